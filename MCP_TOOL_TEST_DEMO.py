@@ -5,6 +5,7 @@ Shows how to use the Causal Memory Core tools via Claude Desktop
 """
 
 import json
+import sys
 
 TOOL_DEMO = {
     "mcp_configuration": {
@@ -139,59 +140,77 @@ TOOL_DEMO = {
     }
 }
 
-def print_demo():
-    print("\n" + "="*80)
-    print("🧠 CAUSAL MEMORY CORE - MCP TOOL DEMONSTRATION")
-    print("="*80)
+# (name, description, parameter names, ((example description, call), ...))
+# frozen once at import in the shape _build_demo walks
+_TOOLS_FLAT = tuple(
+    (
+        name,
+        info['description'],
+        tuple(info['parameters'].keys()),
+        tuple((example['description'], example['call']) for example in info['example_calls'])
+    )
+    for name, info in TOOL_DEMO['available_tools'].items()
+)
+
+def _build_demo() -> str:
+    lines = []
+    lines.append("\n" + "="*80)
+    lines.append("🧠 CAUSAL MEMORY CORE - MCP TOOL DEMONSTRATION")
+    lines.append("="*80)
     
-    print("\n📍 CONFIGURATION STATUS")
-    print("-" * 80)
-    print(f"MCP Server URL: {TOOL_DEMO['mcp_configuration']['servers']['CMC Remote']['url']}")
-    print(f"Type: {TOOL_DEMO['mcp_configuration']['servers']['CMC Remote']['type']}")
-    print(f"Status: ✓ ACTIVE and RESPONDING")
+    lines.append("\n📍 CONFIGURATION STATUS")
+    lines.append("-" * 80)
+    lines.append(f"MCP Server URL: {TOOL_DEMO['mcp_configuration']['servers']['CMC Remote']['url']}")
+    lines.append(f"Type: {TOOL_DEMO['mcp_configuration']['servers']['CMC Remote']['type']}")
+    lines.append(f"Status: ✓ ACTIVE and RESPONDING")
     
-    print("\n🛠️  AVAILABLE TOOLS")
-    print("-" * 80)
-    for tool_name, tool_info in TOOL_DEMO['available_tools'].items():
-        print(f"\n  {tool_name.upper()}")
-        print(f"  Description: {tool_info['description']}")
-        print(f"  Parameters: {', '.join(tool_info['parameters'].keys())}")
-        print(f"  Examples:")
-        for example in tool_info['example_calls']:
-            print(f"    - {example['description']}")
-            print(f"      → {example['call']}")
+    lines.append("\n🛠️  AVAILABLE TOOLS")
+    lines.append("-" * 80)
+    for tool_name, description, parameters, examples in _TOOLS_FLAT:
+        lines.append(f"\n  {tool_name.upper()}")
+        lines.append(f"  Description: {description}")
+        lines.append(f"  Parameters: {', '.join(parameters)}")
+        lines.append(f"  Examples:")
+        for example_description, call in examples:
+            lines.append(f"    - {example_description}")
+            lines.append(f"      → {call}")
     
-    print("\n🔄 USAGE WORKFLOW")
-    print("-" * 80)
+    lines.append("\n🔄 USAGE WORKFLOW")
+    lines.append("-" * 80)
     for step in TOOL_DEMO['usage_workflow']:
-        print(f"\n  Step {step['step']}: {step['action']}")
-        print(f"    Example: {step['example']}")
-        print(f"    Expected: {step['expected_response']}")
+        lines.append(f"\n  Step {step['step']}: {step['action']}")
+        lines.append(f"    Example: {step['example']}")
+        lines.append(f"    Expected: {step['expected_response']}")
     
-    print("\n📋 MEMORY PROTOCOL ENFORCEMENT")
-    print("-" * 80)
+    lines.append("\n📋 MEMORY PROTOCOL ENFORCEMENT")
+    lines.append("-" * 80)
     for rule_key, rule_text in TOOL_DEMO['memory_protocol_rules'].items():
-        print(f"  • {rule_text}")
+        lines.append(f"  • {rule_text}")
     
-    print("\n✅ TEST RESULTS")
-    print("-" * 80)
-    print(f"  Total Tests: {TOOL_DEMO['test_results']['total_tests']}")
-    print(f"  Passed: {TOOL_DEMO['test_results']['passed']}")
-    print(f"  Failed: {TOOL_DEMO['test_results']['failed']}")
-    print(f"  Pass Rate: {TOOL_DEMO['test_results']['pass_rate']}")
-    print(f"\n  Tests Run:")
+    lines.append("\n✅ TEST RESULTS")
+    lines.append("-" * 80)
+    lines.append(f"  Total Tests: {TOOL_DEMO['test_results']['total_tests']}")
+    lines.append(f"  Passed: {TOOL_DEMO['test_results']['passed']}")
+    lines.append(f"  Failed: {TOOL_DEMO['test_results']['failed']}")
+    lines.append(f"  Pass Rate: {TOOL_DEMO['test_results']['pass_rate']}")
+    lines.append(f"\n  Tests Run:")
     for test in TOOL_DEMO['test_results']['tools_tested']:
-        print(f"    {test}")
+        lines.append(f"    {test}")
     
-    print("\n🚀 QUICK START")
-    print("-" * 80)
-    print("\n  For Claude Desktop:")
+    lines.append("\n🚀 QUICK START")
+    lines.append("-" * 80)
+    lines.append("\n  For Claude Desktop:")
     for step in TOOL_DEMO['quick_start']['for_claude_desktop']:
-        print(f"    {step}")
+        lines.append(f"    {step}")
     
-    print("\n" + "="*80)
-    print("Ready to use CMC tools in Claude Desktop! 🎉")
-    print("="*80 + "\n")
+    lines.append("\n" + "="*80)
+    lines.append("Ready to use CMC tools in Claude Desktop! 🎉")
+    lines.append("="*80 + "\n")
+    return '\n'.join(lines)
+
+def print_demo():
+    sys.stdout.write(_build_demo())
+    sys.stdout.write('\n')
 
 if __name__ == "__main__":
     print_demo()
@@ -17,17 +17,36 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from src.causal_memory_core import CausalMemoryCore
 
-def run_diagnostic_tests():
+def _write_progress(event_ids, events):
+    """Report a finished batch with a single stdout write"""
+    lines = [
+        f"[{i}/{len(events)}] Added #{event_id}: {event[:60]}..."
+        for i, (event_id, event) in enumerate(zip(event_ids, events), 1)
+    ]
+    sys.stdout.write("\n".join(lines) + "\n")
+
+def run_diagnostic_tests(core=None):
+    """Run the three diagnostic iterations.
+    
+    Pass an existing ``core`` to reuse it (e.g. when sweeping thresholds):
+    it is reset instead of re-created, skipping the embedding model load,
+    and is left open for the caller. Resetting deletes every event in the
+    core's database, so only pass a core opened on a scratch database.
+    """
     # Create temp database for clean test
     import uuid
     temp_dir = tempfile.gettempdir()
-    temp_db_path = os.path.join(temp_dir, f"betty_diagnostic_{uuid.uuid4().hex[:8]}.db")
-    log_dir = temp_dir
-    log_file = f"causality_diagnostic_{uuid.uuid4().hex[:8]}.log"
-    log_path = os.path.join(log_dir, log_file)
+    run_id = uuid.uuid4().hex[:8]
+    log_path = os.path.join(temp_dir, f"causality_diagnostic_{run_id}.log")
     
-    # Initialize core with explicit db_path to bypass env var
-    core = CausalMemoryCore(db_path=temp_db_path)
+    owns_core = core is None
+    if owns_core:
+        # Initialize core with explicit db_path to bypass env var
+        temp_db_path = os.path.join(temp_dir, f"betty_diagnostic_{run_id}.db")
+        core = CausalMemoryCore(db_path=temp_db_path)
+    else:
+        temp_db_path = core.db_path
+        core.reset()
     
     # Clear existing log
     if os.path.exists(log_path):
@@ -63,9 +82,8 @@ def run_diagnostic_tests():
         "Albedo tested the MCP connection by adding events and querying memory"
     ]
     
-    for i, event in enumerate(iteration1_events, 1):
-        print(f"[{i}/10] Adding: {event[:60]}...")
-        core.add_event(event)
+    event_ids = core.add_events(iteration1_events)
+    _write_progress(event_ids, iteration1_events)
     
     # ========================================================================
     # TEST ITERATION 2: Code Refactoring Workflow (10% in original test)
@@ -88,9 +106,8 @@ def run_diagnostic_tests():
         "Code was merged into main branch after approval"
     ]
     
-    for i, event in enumerate(iteration2_events, 1):
-        print(f"[{i}/10] Adding: {event[:60]}...")
-        core.add_event(event)
+    event_ids = core.add_events(iteration2_events)
+    _write_progress(event_ids, iteration2_events)
     
     # ========================================================================
     # TEST ITERATION 3: Production Incident Resolution (10% in original test)
@@ -113,9 +130,8 @@ def run_diagnostic_tests():
         "Team implemented automated query performance testing in CI pipeline"
     ]
     
-    for i, event in enumerate(iteration3_events, 1):
-        print(f"[{i}/10] Adding: {event[:60]}...")
-        core.add_event(event)
+    event_ids = core.add_events(iteration3_events)
+    _write_progress(event_ids, iteration3_events)
     
     # ========================================================================
     # ANALYSIS COMPLETE
@@ -133,10 +149,10 @@ def run_diagnostic_tests():
     print("\n" + "=" * 80)
     
     # Cleanup
-    core.close()
-    os.unlink(temp_db_path)
-    
-    print(f"\n✓ Test database cleaned up: {temp_db_path}")
+    if owns_core:
+        core.close()
+        os.unlink(temp_db_path)
+        print(f"\n✓ Test database cleaned up: {temp_db_path}")
     print(f"✓ Diagnostic log preserved for Betty's analysis: {log_path}\n")
 
 if __name__ == "__main__":
@@ -7,15 +7,21 @@ Provides an interactive way to add events and query memory
 import os
 import sys
 import argparse
-from dotenv import load_dotenv
+import functools
 
 # Prefer importing the module to keep it patchable via 'src.causal_memory_core.CausalMemoryCore'
 try:
     import src.causal_memory_core as cmcore  # type: ignore
-except Exception:  # Fallback for direct execution contexts
+except ModuleNotFoundError as exc:  # Fallback for direct execution contexts
+    # Only a missing src package means "not run from the repo root"; errors
+    # raised inside the module (or missing dependencies) must surface
+    if exc.name not in ('src', 'src.causal_memory_core'):
+        raise
     sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
     import causal_memory_core as cmcore  # type: ignore
 
+from config import load_env
+
 class _CausalMemoryCoreFactory:
     """Factory wrapper so tests can patch either cli.CausalMemoryCore or src.causal_memory_core.CausalMemoryCore."""
     def __call__(self, *args, **kwargs):
@@ -25,31 +31,42 @@ class _CausalMemoryCoreFactory:
 CausalMemoryCore = _CausalMemoryCoreFactory()
 
 
-def _safe_print(message: str) -> None:
-    """Print text with emoji, but fall back to ASCII if the current stdout encoding
-    cannot represent certain characters (e.g., Windows code pages).
-    """
+# ASCII stand-ins for the symbols the CLI prints, applied in one translate() pass
+_ASCII_FALLBACK = str.maketrans({
+    '✅': '[OK]',
+    '❌': '[ERROR]',
+    '📖': 'Context',
+    '🧠': 'Causal Memory Core',
+    '👋': 'Goodbye!',
+    '→': '->',
+})
+
+
+def _stdout_supports(chars: str) -> bool:
     enc = getattr(sys.stdout, 'encoding', None) or 'utf-8'
     try:
-        _ = message.encode(enc)
-        print(message)
+        chars.encode(enc)
     except UnicodeEncodeError:
-        replacements = {
-            '✅': '[OK]',
-            '❌': '[ERROR]',
-            '📖': 'Context',
-            '🧠': 'Causal Memory Core',
-            '👋': 'Goodbye!',
-            '→': '->',
-        }
-        ascii_msg = message
-        for k, v in replacements.items():
-            ascii_msg = ascii_msg.replace(k, v)
-        try:
-            print(ascii_msg)
-        except Exception:
-            # Last resort: strip non-ASCII
-            print(ascii_msg.encode(enc, errors='ignore').decode(enc, errors='ignore'))
+        return False
+    return True
+
+
+def _ascii_print(message: str) -> None:
+    """Print text with the CLI's emoji replaced by ASCII, for stdout encodings
+    that cannot represent them (e.g., Windows code pages).
+    """
+    ascii_msg = message.translate(_ASCII_FALLBACK)
+    try:
+        print(ascii_msg)
+    except Exception:
+        # Last resort: replace anything the encoding cannot represent
+        enc = getattr(sys.stdout, 'encoding', None) or 'utf-8'
+        print(ascii_msg.encode(enc, errors='replace').decode(enc))
+
+
+# Probe the stdout encoding once at import rather than on every message; a
+# stream that can encode these symbols can encode any text the CLI prints.
+_safe_print = print if _stdout_supports('✅❌📖🧠👋→') else _ascii_print
 
 
 def add_event_command(memory_core, event_text):
@@ -71,14 +88,41 @@ def query_command(memory_core, query_text):
         _safe_print(f"❌ Error querying memory: {e}")
 
 
+_INTERACTIVE_HELP = (
+    "Commands:",
+    "  add <event>    - Add an event to memory",
+    "  query <text>   - Query memory for context",
+    "  help          - Show this help",
+    "  quit          - Exit",
+)
+
+_QUIT_COMMANDS = frozenset(('quit', 'exit', 'q'))
+_HELP_COMMANDS = frozenset(('help', 'h'))
+
+# Interactive commands that take an argument, keyed by lowercased name
+_INTERACTIVE_COMMANDS = {
+    'add': add_event_command,
+    'query': query_command,
+}
+
+
+def _print_interactive_help() -> None:
+    for line in _INTERACTIVE_HELP:
+        _safe_print(line)
+
+
 def interactive_mode(memory_core):
     """Run in interactive mode"""
+    # Line editing only helps a human at a terminal; piped input skips readline
+    if sys.stdin.isatty():
+        try:
+            import readline
+            readline.set_history_length(1000)
+        except ImportError:  # Not available on Windows
+            pass
+
     _safe_print("🧠 Causal Memory Core - Interactive Mode")
-    _safe_print("Commands:")
-    _safe_print("  add <event>    - Add an event to memory")
-    _safe_print("  query <text>   - Query memory for context")
-    _safe_print("  help          - Show this help")
-    _safe_print("  quit          - Exit")
+    _print_interactive_help()
     _safe_print("")
     
     while True:
@@ -87,25 +131,20 @@ def interactive_mode(memory_core):
             
             if not user_input:
                 continue
-                
-            if user_input.lower() in ['quit', 'exit', 'q']:
-                break
-                
-            if user_input.lower() in ['help', 'h']:
-                _safe_print("Commands:")
-                _safe_print("  add <event>    - Add an event to memory")
-                _safe_print("  query <text>   - Query memory for context")
-                _safe_print("  help          - Show this help")
-                _safe_print("  quit          - Exit")
-                continue
             
-            parts = user_input.split(' ', 1)
-            command = parts[0].lower()
+            command, _, argument = user_input.partition(' ')
+            command = command.lower()
             
-            if command == 'add' and len(parts) > 1:
-                add_event_command(memory_core, parts[1])
-            elif command == 'query' and len(parts) > 1:
-                query_command(memory_core, parts[1])
+            if not argument:
+                if command in _QUIT_COMMANDS:
+                    break
+                if command in _HELP_COMMANDS:
+                    _print_interactive_help()
+                    continue
+            
+            handler = _INTERACTIVE_COMMANDS.get(command)
+            if handler is not None and argument:
+                handler(memory_core, argument)
             else:
                 _safe_print("❌ Invalid command. Type 'help' for available commands.")
                 
@@ -135,23 +174,54 @@ Examples:
     return parser
 
 
+@functools.lru_cache(maxsize=None)
+def _get_parser() -> argparse.ArgumentParser:
+    """Build the argument parser once and reuse it for every main() call."""
+    return build_parser()
+
+
+# Option spellings the fast path maps straight onto their Namespace field
+_FAST_OPTIONS = {'--add': 'add', '-a': 'add', '--query': 'query', '-q': 'query'}
+
+
+def _fast_parse(argv):
+    """Parse the common single ``--add X`` / ``--query X`` forms without argparse.
+
+    Returns None for anything else (including values that look like options),
+    so argparse still handles errors, help and every other shape.
+    """
+    if len(argv) != 2:
+        return None
+    dest = _FAST_OPTIONS.get(argv[0])
+    if dest is None or argv[1].startswith('-'):
+        return None
+    args = argparse.Namespace(add=None, query=None, interactive=False, db_path=None)
+    setattr(args, dest, argv[1])
+    return args
+
+
 def parse_args(argv=None):
-    return build_parser().parse_args(argv)
+    if argv is None:
+        argv = sys.argv[1:]
+    return _fast_parse(argv) or _get_parser().parse_args(argv)
 
 
-def _exit_or_return(code: int) -> int:
-    """If sys.exit is patched (tests), let it raise. Otherwise return code."""
-    try:
-        # Detect if sys.exit is mocked by checking for attribute typical of Mock
-        if hasattr(sys.exit, 'side_effect') or hasattr(sys.exit, 'assert_called'):  # type: ignore[attr-defined]
-            sys.exit(code)
-    except SystemExit:
-        raise
+def _exit_or_return(code: int, exit=None) -> int:
+    """Call the injected exit callable if given; otherwise, if sys.exit is
+    patched (tests), let it raise. In all other cases return code.
+    """
+    if exit is None:
+        # Detect if sys.exit is mocked by checking for an attribute typical of Mock
+        if not hasattr(sys.exit, 'assert_called'):
+            return code
+        exit = sys.exit
+    exit(code)
     return code
 
-def main(argv=None) -> int:
+def main(argv=None, exit=None) -> int:
     """Main CLI function. Accepts argv for in-process invocation in tests.
-    Returns process exit code (0 success, 1 error).
+    Returns process exit code (0 success, 1 error). If an ``exit`` callable is
+    given it is called with the code on error paths instead.
     """
     args = parse_args(argv)
 
@@ -160,19 +230,19 @@ def main(argv=None) -> int:
     
     # If no action command, just show help
     if not needs_memory_core:
-        build_parser().print_help()
+        _get_parser().print_help()
         return 0
 
-    # Load environment variables (skippable for tests via CMC_SKIP_DOTENV=1)
-    if os.getenv('CMC_SKIP_DOTENV') != '1':
-        load_dotenv()
+    # Load environment variables once, only now that an action needs them
+    # (skippable for tests via CMC_SKIP_DOTENV=1)
+    load_env()
 
     # Check if we have required configuration
     if not os.getenv('OPENAI_API_KEY'):
         _safe_print("❌ Error: OPENAI_API_KEY not found in environment")
         _safe_print("Please set up your .env file with your OpenAI API key")
         _safe_print("See .env.template for an example")
-        return _exit_or_return(1)
+        return _exit_or_return(1, exit)
 
     # Initialize memory core only when needed
     memory_core = None
@@ -183,7 +253,7 @@ def main(argv=None) -> int:
         _safe_print("✅ Causal Memory Core initialized")
     except Exception as e:
         _safe_print(f"❌ Error initializing memory core: {e}")
-        return _exit_or_return(1)
+        return _exit_or_return(1, exit)
 
     try:
         # Handle commands
@@ -201,4 +271,4 @@ def main(argv=None) -> int:
     return 0
 
 if __name__ == "__main__":
-    main()
+    main(exit=sys.exit)
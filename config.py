@@ -1,40 +1,83 @@
 import os
-from dotenv import load_dotenv
 
-load_dotenv()
+_env_loaded = False
+
+
+def load_env():
+    """Load the .env file into os.environ once per process.
+
+    Called on first Config setting access and by entry points that read
+    os.environ directly, so fast paths such as ``cli.py --help`` never touch
+    the file. Set CMC_SKIP_DOTENV=1 to skip it (tests).
+    """
+    global _env_loaded
+    if _env_loaded:
+        return
+    _env_loaded = True
+    if os.getenv('CMC_SKIP_DOTENV') == '1':
+        return
+    from dotenv import load_dotenv
+    load_dotenv()
+
+
+class _EnvSetting:
+    """Setting read from the environment on first access, then cached.
+
+    The first lookup (on the class or an instance) replaces the descriptor
+    with the converted value on the owning class, so later reads are plain
+    attribute loads and no work is done for settings that are never used.
+    """
+
+    __slots__ = ('name', 'default', 'cast')
+
+    def __init__(self, default=None, cast=None):
+        self.default = default
+        self.cast = cast
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, instance, owner):
+        load_env()
+        value = os.getenv(self.name, self.default)
+        if value is not None and self.cast is not None:
+            value = self.cast(value)
+        setattr(owner, self.name, value)
+        return value
+
 
 class Config:
     """Configuration settings for the Causal Memory Core"""
-    
+
     # Database settings
-    DB_PATH = os.getenv('DB_PATH', 'causal_memory.db')
-    
+    DB_PATH = _EnvSetting('causal_memory.db')
+
     # Embedding model settings
-    EMBEDDING_MODEL = os.getenv('EMBEDDING_MODEL', 'all-MiniLM-L6-v2')
+    EMBEDDING_MODEL = _EnvSetting('all-MiniLM-L6-v2')
     EMBEDDING_DIMENSION = 384  # Dimension for all-MiniLM-L6-v2
-    
+
     # LLM settings
-    OPENAI_API_KEY = os.getenv('OPENAI_API_KEY')
-    OPENAI_BASE_URL = os.getenv('OPENAI_BASE_URL')
-    LLM_MODEL = os.getenv('LLM_MODEL', 'gpt-4')
-    LLM_TEMPERATURE = float(os.getenv('LLM_TEMPERATURE', '0.1'))
-    
+    OPENAI_API_KEY = _EnvSetting()
+    OPENAI_BASE_URL = _EnvSetting()
+    LLM_MODEL = _EnvSetting('gpt-4')
+    LLM_TEMPERATURE = _EnvSetting('0.1', float)
+
     # Search settings
-    MAX_POTENTIAL_CAUSES = int(os.getenv('MAX_POTENTIAL_CAUSES', '5'))
-    SIMILARITY_THRESHOLD = float(os.getenv('SIMILARITY_THRESHOLD', '0.5'))
-    TIME_DECAY_HOURS = int(os.getenv('TIME_DECAY_HOURS', '24'))
+    MAX_POTENTIAL_CAUSES = _EnvSetting('5', int)
+    SIMILARITY_THRESHOLD = _EnvSetting('0.5', float)
+    TIME_DECAY_HOURS = _EnvSetting('24', int)
 
     # Narrative chain settings
-    MAX_CONSEQUENCE_DEPTH = int(os.getenv('MAX_CONSEQUENCE_DEPTH', '2'))
+    MAX_CONSEQUENCE_DEPTH = _EnvSetting('2', int)
 
     # Vitality / forgetting
-    DECAY_RATE = float(os.getenv('DECAY_RATE', '0.001'))
-    ACCESS_BOOST = float(os.getenv('ACCESS_BOOST', '0.2'))
-    CAUSAL_BOOST = float(os.getenv('CAUSAL_BOOST', '0.1'))
-    MAX_TTL_HOURS = int(os.getenv('MAX_TTL_HOURS', '8760'))
-    ARCHIVE_THRESHOLD = float(os.getenv('ARCHIVE_THRESHOLD', '0.05'))
-    MAINTENANCE_INTERVAL_HOURS = int(os.getenv('MAINTENANCE_INTERVAL_HOURS', '6'))
+    DECAY_RATE = _EnvSetting('0.001', float)
+    ACCESS_BOOST = _EnvSetting('0.2', float)
+    CAUSAL_BOOST = _EnvSetting('0.1', float)
+    MAX_TTL_HOURS = _EnvSetting('8760', int)
+    ARCHIVE_THRESHOLD = _EnvSetting('0.05', float)
+    MAINTENANCE_INTERVAL_HOURS = _EnvSetting('6', int)
 
     # MCP Server settings
-    MCP_SERVER_NAME = os.getenv('MCP_SERVER_NAME', 'causal-memory-core')
-    MCP_SERVER_VERSION = os.getenv('MCP_SERVER_VERSION', '1.2.0')
+    MCP_SERVER_NAME = _EnvSetting('causal-memory-core')
+    MCP_SERVER_VERSION = _EnvSetting('1.2.0')
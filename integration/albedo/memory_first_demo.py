@@ -14,16 +14,16 @@ It demonstrates:
 Notes
  - Marked as PROTOTYPE to respect the NO SIMULATIONS LAW while executing real
      interactions with the core. External actions are printed only.
- - Uses a temporary DuckDB file unless DB_PATH env is set to preserve working DBs.
+ - Uses an in-memory DuckDB database unless DB_PATH env is set to preserve working DBs.
  - Requires LM Studio server running with OpenAI-compatible API (default http://localhost:1234/v1).
 """
 
 from __future__ import annotations
 
+import contextlib
 import os
 import sys
 import pathlib
-import tempfile
 from dataclasses import dataclass
 
 from openai import OpenAI
@@ -33,8 +33,11 @@ ROOT = pathlib.Path(__file__).resolve().parents[2]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
+from config import load_env
 from src.causal_memory_core import CausalMemoryCore
 
+load_env()
+
 
 @dataclass
 class Decision:
@@ -43,15 +46,9 @@ class Decision:
 
 
 def run_memory_first_demo(decision: Decision) -> None:
-    # Use a temporary DB by default to avoid altering the main DB.
-    db_path = os.getenv("DB_PATH")
-    cleanup = False
-    if not db_path:
-        tmp = tempfile.NamedTemporaryFile(delete=False, suffix=".db")
-        db_path = tmp.name
-        tmp.close()
-        # DuckDB creates on first connect; we unlink at end
-        cleanup = True
+    # Use an in-memory DB by default to avoid altering the main DB; the demo
+    # needs no durability, so this skips all file and WAL I/O.
+    db_path = os.getenv("DB_PATH") or ":memory:"
 
     # Configure LM Studio OpenAI-compatible endpoint
     base_url = os.getenv("OPENAI_BASE_URL", "http://localhost:1234/v1")
@@ -67,22 +64,24 @@ def run_memory_first_demo(decision: Decision) -> None:
         time_decay_hours=None,
     )
 
-    try:
+    with contextlib.closing(core):
         # Show which model and endpoint are configured
         from config import Config as _Cfg
         print(f"LLM model: {os.getenv('LLM_MODEL', _Cfg.LLM_MODEL)}")
         print(f"LLM base URL: {base_url}")
         print()
         
-        # Seed a cause-effect pair to trigger LLM causality judgment
-        print("=== Seeding initial event ===")
-        core.add_event("User clicked the deploy button")
-        print("Event 1 recorded: User clicked the deploy button")
-        print()
-        
-        print("=== Adding related event (should trigger causality check) ===")
-        core.add_event("Deployment pipeline started running")
-        print("Event 2 recorded: Deployment pipeline started running")
+        # Seed a cause-effect pair to trigger LLM causality judgment. Both
+        # events go in one add_events call (one embedding batch, one
+        # transaction); the second is still linked against the first.
+        print("=== Seeding initial event and related event (should trigger causality check) ===")
+        seed_events = [
+            "User clicked the deploy button",
+            "Deployment pipeline started running",
+        ]
+        core.add_events(seed_events)
+        for number, text in enumerate(seed_events, start=1):
+            print(f"Event {number} recorded: {text}")
         print()
         
         # 1) QUERY
@@ -115,13 +114,6 @@ def run_memory_first_demo(decision: Decision) -> None:
         follow_up = core.get_context("deployment pipeline")
         print("--- Follow-up Context ---")
         print(follow_up)
-    finally:
-        core.close()
-        if cleanup:
-            try:
-                os.unlink(db_path)
-            except Exception:
-                pass
 
 
 if __name__ == "__main__":
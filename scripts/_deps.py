@@ -0,0 +1,26 @@
+"""
+Dependency probes shared by the test runner scripts
+"""
+
+import functools
+import importlib.util
+import sys
+
+
+@functools.lru_cache(maxsize=None)
+def probe(package):
+    """Return True if ``package`` (an import name) can be imported
+
+    Uses find_spec, so the package is located but not imported; results
+    are cached for the life of the process.
+    """
+    return importlib.util.find_spec(package) is not None
+
+
+def missing(required):
+    """Return the packages from ``required`` that cannot be imported"""
+    return [package for package in required if not probe(package)]
+
+
+# Non-interactive, and skip pip's own update check (a network round-trip)
+PIP_INSTALL = [sys.executable, '-m', 'pip', 'install', '--no-input', '--disable-pip-version-check']
@@ -0,0 +1,27 @@
+"""
+JSON helpers shared by the benchmark and test runner scripts
+
+Uses orjson when it is installed and falls back to the standard library.
+Both sides take and return bytes, so files are opened in binary mode.
+"""
+
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+if orjson is not None:
+    loads = orjson.loads
+
+    def dumps(obj, default=None):
+        """Serialize ``obj`` as indented UTF-8 JSON bytes"""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2, default=default)
+else:
+    loads = json.loads
+
+    def dumps(obj, default=None):
+        """Serialize ``obj`` as indented UTF-8 JSON bytes"""
+        return json.dumps(obj, indent=2, default=default).encode('utf-8')
@@ -5,119 +5,283 @@ Analyzes benchmark results and generates comprehensive reports
 """
 
 import os
-import json
-import glob
+import math
+import pickle
+import time
+from array import array
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timezone
-import statistics
 from pathlib import Path
 
-try:
-    import matplotlib.pyplot as plt
-    import pandas as pd
-    HAS_PLOTTING = True
-except ImportError:
-    HAS_PLOTTING = False
+import numpy as np
+
+from _jsonio import dumps as _dumps, loads as _loads
+
+
+class RunningStats:
+    """Single-pass (Welford) accumulator for one benchmark metric
+
+    Mean, stddev, min and max are kept in O(1) state. The exact median has
+    no online form, so every observation is also kept in a packed
+    ``array('d')``: memory still grows with the number of records (8 bytes
+    per value), just far less than holding the parsed records would.
+    """
+    
+    __slots__ = ('n', 'mean', 'm2', 'min', 'max', 'values')
+    
+    def __init__(self):
+        self.n = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = None
+        self.max = None
+        # Packed doubles: 8 bytes per observation instead of a float object
+        self.values = array('d')
+    
+    def push(self, x):
+        """Fold one observation into the running statistics"""
+        # Work on locals; attribute loads dominate this per-record path
+        n = self.n + 1
+        mean = self.mean
+        delta = x - mean
+        mean += delta / n
+        self.m2 += delta * (x - mean)
+        self.n = n
+        self.mean = mean
+        if self.min is None or x < self.min:
+            self.min = x
+        if self.max is None or x > self.max:
+            self.max = x
+        # Kept only for the median, which has no exact online form
+        self.values.append(x)
+    
+    def merge(self, other):
+        """Fold another accumulator in (parallel Welford combine)"""
+        if not other.n:
+            return
+        n = self.n + other.n
+        delta = other.mean - self.mean
+        self.mean += delta * other.n / n
+        self.m2 += other.m2 + delta * delta * self.n * other.n / n
+        self.n = n
+        if self.min is None or other.min < self.min:
+            self.min = other.min
+        if self.max is None or other.max > self.max:
+            self.max = other.max
+        self.values.extend(other.values)
+    
+    def summary(self):
+        """Return the metric summary in the report's dict layout"""
+        if not self.n:
+            return {'mean': 0.0, 'median': 0.0, 'min': 0.0, 'max': 0.0, 'stddev': 0.0}
+        return {
+            'mean': float(self.mean),
+            'median': float(np.median(np.frombuffer(self.values))),
+            'min': float(self.min),
+            'max': float(self.max),
+            'stddev': math.sqrt(self.m2 / (self.n - 1)) if self.n > 1 else 0.0
+        }
+
+
+class BenchmarkAggregate:
+    """Mergeable per-test aggregate of benchmark records"""
+    
+    __slots__ = ('total', 'by_test', 'earliest', 'latest')
+    
+    def __init__(self):
+        self.total = 0
+        # test_name -> [count, execution RunningStats, memory RunningStats]
+        self.by_test = {}
+        self.earliest = None
+        self.latest = None
+    
+    def _group(self, test_name):
+        group = self.by_test.get(test_name)
+        if group is None:
+            group = self.by_test[test_name] = [0, RunningStats(), RunningStats()]
+        return group
+    
+    def add(self, benchmark):
+        """Fold one benchmark record into the aggregate"""
+        self.total += 1
+        group = self._group(benchmark.get('test_name', 'unknown'))
+        group[0] += 1
+        if 'execution_time_seconds' in benchmark:
+            group[1].push(benchmark['execution_time_seconds'])
+        if 'memory_delta_mb' in benchmark:
+            group[2].push(benchmark['memory_delta_mb'])
+        
+        # Track the date range on normalized ISO-8601 strings, which
+        # order lexicographically; no per-record datetime parsing
+        ts = benchmark.get('timestamp')
+        if ts and isinstance(ts, str):
+            if ts.endswith('Z'):
+                ts = ts[:-1] + '+00:00'
+            self._extend_range(ts, ts)
+    
+    def _extend_range(self, earliest, latest):
+        if earliest is not None and (self.earliest is None or earliest < self.earliest):
+            self.earliest = earliest
+        if latest is not None and (self.latest is None or latest > self.latest):
+            self.latest = latest
+    
+    def merge(self, other):
+        """Fold another aggregate (e.g. one per file) into this one"""
+        self.total += other.total
+        for test_name, (count, execution_times, memory_deltas) in other.by_test.items():
+            group = self._group(test_name)
+            group[0] += count
+            group[1].merge(execution_times)
+            group[2].merge(memory_deltas)
+        self._extend_range(other.earliest, other.latest)
+
+
+def _aggregate_file(loader, path):
+    """Aggregate one benchmark file; module-level so worker processes can run it"""
+    file_aggregate = BenchmarkAggregate()
+    add = file_aggregate.add
+    for benchmark in loader(path):
+        add(benchmark)
+    return file_aggregate
+
 
 class BenchmarkAnalyzer:
     """Analyzes and reports on benchmark test results"""
     
+    CACHE_FILE = ".analysis_cache.pkl"
+    # Below this many changed files, parsing inline beats process start-up
+    PARALLEL_MIN_FILES = 4
+    
     def __init__(self, results_dir="test_results/benchmarks"):
         self.results_dir = Path(results_dir)
         self.results_dir.mkdir(parents=True, exist_ok=True)
+        self.cache_file = self.results_dir / self.CACHE_FILE
+    
+    def _load_json(self, path):
+        """Yield the benchmark record stored in a single JSON file"""
+        try:
+            with open(path, 'rb') as f:
+                benchmark_data = _loads(f.read())
+                benchmark_data['source_file'] = path
+                yield benchmark_data
+        except Exception as e:
+            print(f"Warning: Could not load {path}: {e}")
+    
+    def _load_jsonl(self, path):
+        """Yield each benchmark record of a daily summary (JSONL) file"""
+        try:
+            with open(path, 'rb') as f:
+                for line in f:
+                    if line.strip():
+                        benchmark_data = _loads(line)
+                        benchmark_data['source_file'] = path
+                        yield benchmark_data
+        except Exception as e:
+            print(f"Warning: Could not load {path}: {e}")
+    
+    def _benchmark_files(self):
+        """Yield (entry, loader) pairs for every benchmark file, in one lazy directory pass"""
+        with os.scandir(self.results_dir) as entries:
+            for entry in entries:
+                name = entry.name
+                if not entry.is_file():
+                    continue
+                if name.endswith('.json'):
+                    yield entry, self._load_json
+                elif name.startswith('daily_benchmarks_') and name.endswith('.jsonl'):
+                    yield entry, self._load_jsonl
+    
+    def _read_cache(self):
+        try:
+            with open(self.cache_file, 'rb') as f:
+                return pickle.load(f)
+        except Exception:
+            return {}
     
-    def load_benchmark_data(self):
-        """Load all benchmark data from JSON files"""
-        data = []
-        
-        # Load individual benchmark files
-        for json_file in glob.glob(str(self.results_dir / "*.json")):
-            try:
-                with open(json_file, 'r') as f:
-                    benchmark_data = json.load(f)
-                    benchmark_data['source_file'] = json_file
-                    data.append(benchmark_data)
-            except Exception as e:
-                print(f"Warning: Could not load {json_file}: {e}")
-        
-        # Load daily summary files (JSONL format)
-        for jsonl_file in glob.glob(str(self.results_dir / "daily_benchmarks_*.jsonl")):
-            try:
-                with open(jsonl_file, 'r') as f:
-                    for line in f:
-                        if line.strip():
-                            benchmark_data = json.loads(line.strip())
-                            benchmark_data['source_file'] = jsonl_file
-                            data.append(benchmark_data)
-            except Exception as e:
-                print(f"Warning: Could not load {jsonl_file}: {e}")
-        
-        print(f"📊 Loaded {len(data)} benchmark data points")
-        return data
+    def _write_cache(self, cache):
+        try:
+            with open(self.cache_file, 'wb') as f:
+                pickle.dump(cache, f, protocol=pickle.HIGHEST_PROTOCOL)
+        except OSError as e:
+            print(f"Warning: Could not write analysis cache {self.cache_file}: {e}")
+    
+    def _aggregate_files(self, stale):
+        """Aggregate (path, loader) pairs, one process per core when there are several"""
+        if len(stale) < self.PARALLEL_MIN_FILES:
+            return [_aggregate_file(loader, path) for path, loader in stale]
+        
+        workers = min(len(stale), os.cpu_count() or 1)
+        chunksize = max(1, len(stale) // (workers * 4))
+        paths = [path for path, _ in stale]
+        loaders = [loader for _, loader in stale]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(_aggregate_file, loaders, paths, chunksize=chunksize))
+    
+    def load_benchmark_aggregate(self):
+        """Aggregate all benchmark files, re-parsing only files changed since the last run
+        
+        Per-file aggregates are cached in CACHE_FILE keyed by (mtime_ns, size),
+        so historical results that never change are parsed once. Changed files
+        are parsed in parallel and merged with the parallel Welford combine.
+        """
+        cache = self._read_cache()
+        fresh_cache = {}
+        stale = []
+        
+        for entry, loader in self._benchmark_files():
+            st = entry.stat()
+            key = (st.st_mtime_ns, st.st_size)
+            cached = cache.get(entry.path)
+            if cached is not None and cached[0] == key:
+                fresh_cache[entry.path] = cached
+            else:
+                fresh_cache[entry.path] = (key, None)
+                stale.append((entry.path, loader))
+        
+        for (path, _), file_aggregate in zip(stale, self._aggregate_files(stale)):
+            fresh_cache[path] = (fresh_cache[path][0], file_aggregate)
+        
+        aggregate = BenchmarkAggregate()
+        for _, file_aggregate in fresh_cache.values():
+            aggregate.merge(file_aggregate)
+        
+        # Rewrite when files were re-parsed or removed
+        if stale or fresh_cache.keys() != cache.keys():
+            self._write_cache(fresh_cache)
+        
+        print(f"📊 Loaded {aggregate.total} benchmark data points "
+              f"({len(stale)} of {len(fresh_cache)} files parsed)")
+        return aggregate
     
     def analyze_performance_trends(self, data):
-        """Analyze performance trends across benchmark runs"""
+        """Analyze performance trends across benchmark runs
+        
+        ``data`` is an iterable of benchmark records or a BenchmarkAggregate.
+        """
+        if isinstance(data, BenchmarkAggregate):
+            aggregate = data
+        else:
+            aggregate = BenchmarkAggregate()
+            add = aggregate.add
+            for benchmark in data:
+                add(benchmark)
+        
         analysis = {
             'summary': {
-                'total_benchmarks': len(data),
-                'test_types': set(),
-                'date_range': {'earliest': None, 'latest': None}
+                'total_benchmarks': aggregate.total,
+                'test_types': set(aggregate.by_test),
+                'date_range': {'earliest': aggregate.earliest, 'latest': aggregate.latest}
             },
             'by_test_type': {},
             'performance_metrics': {},
             'trends': {}
         }
         
-        # Group data by test type
-        by_test = {}
-        timestamps = []
-        
-        for benchmark in data:
-            test_name = benchmark.get('test_name', 'unknown')
-            analysis['summary']['test_types'].add(test_name)
-            
-            if test_name not in by_test:
-                by_test[test_name] = []
-            by_test[test_name].append(benchmark)
-            
-            # Track timestamps
-            if 'timestamp' in benchmark:
-                try:
-                    ts = datetime.fromisoformat(benchmark['timestamp'].replace('Z', '+00:00'))
-                    timestamps.append(ts)
-                except:
-                    pass
-        
-        if timestamps:
-            analysis['summary']['date_range']['earliest'] = min(timestamps).isoformat()
-            analysis['summary']['date_range']['latest'] = max(timestamps).isoformat()
-        
-        # Analyze each test type
-        for test_name, test_data in by_test.items():
-            execution_times = []
-            memory_deltas = []
-            
-            for test in test_data:
-                if 'execution_time_seconds' in test:
-                    execution_times.append(test['execution_time_seconds'])
-                if 'memory_delta_mb' in test:
-                    memory_deltas.append(test['memory_delta_mb'])
-            
+        for test_name, (count, execution_times, memory_deltas) in aggregate.by_test.items():
             analysis['by_test_type'][test_name] = {
-                'count': len(test_data),
-                'execution_times': {
-                    'mean': statistics.mean(execution_times) if execution_times else 0,
-                    'median': statistics.median(execution_times) if execution_times else 0,
-                    'min': min(execution_times) if execution_times else 0,
-                    'max': max(execution_times) if execution_times else 0,
-                    'stddev': statistics.stdev(execution_times) if len(execution_times) > 1 else 0
-                },
-                'memory_usage': {
-                    'mean': statistics.mean(memory_deltas) if memory_deltas else 0,
-                    'median': statistics.median(memory_deltas) if memory_deltas else 0,
-                    'min': min(memory_deltas) if memory_deltas else 0,
-                    'max': max(memory_deltas) if memory_deltas else 0,
-                    'stddev': statistics.stdev(memory_deltas) if len(memory_deltas) > 1 else 0
-                }
+                'count': count,
+                'execution_times': execution_times.summary(),
+                'memory_usage': memory_deltas.summary()
             }
         
         return analysis
@@ -126,7 +290,8 @@ class BenchmarkAnalyzer:
         """Generate comprehensive performance report"""
         timestamp = datetime.now(timezone.utc)
         
-        report = f"""# Causal Memory Core - Benchmark Analysis Report
+        parts = []
+        parts.append(f"""# Causal Memory Core - Benchmark Analysis Report
 
 **Generated**: {timestamp.strftime('%Y-%m-%d %H:%M UTC')}
 
@@ -138,10 +303,10 @@ class BenchmarkAnalyzer:
 
 ## Performance Analysis by Test Type
 
-"""
+""")
         
         for test_name, metrics in analysis['by_test_type'].items():
-            report += f"""### {test_name}
+            parts.append(f"""### {test_name}
 
 **Execution Performance**:
 - Runs: {metrics['count']}
@@ -156,37 +321,38 @@ class BenchmarkAnalyzer:
 - Range: {metrics['memory_usage']['min']:.2f}MB - {metrics['memory_usage']['max']:.2f}MB
 - Std Dev: {metrics['memory_usage']['stddev']:.2f}MB
 
-"""
+""")
         
         # Add performance insights
-        report += """## Performance Insights
+        parts.append("""## Performance Insights
 
-"""
+""")
         
-        # Find fastest and slowest tests
+        # Find fastest/slowest and most/least memory tests in one pass
         if analysis['by_test_type']:
-            fastest_test = min(analysis['by_test_type'].items(), 
-                             key=lambda x: x[1]['execution_times']['mean'])
-            slowest_test = max(analysis['by_test_type'].items(), 
-                             key=lambda x: x[1]['execution_times']['mean'])
-            
-            report += f"- **Fastest Test**: {fastest_test[0]} ({fastest_test[1]['execution_times']['mean']:.3f}s avg)\n"
-            report += f"- **Slowest Test**: {slowest_test[0]} ({slowest_test[1]['execution_times']['mean']:.3f}s avg)\n"
-            
-            # Memory efficiency
-            most_memory = max(analysis['by_test_type'].items(), 
-                            key=lambda x: x[1]['memory_usage']['mean'])
-            least_memory = min(analysis['by_test_type'].items(), 
-                             key=lambda x: x[1]['memory_usage']['mean'])
+            fastest_test = slowest_test = most_memory = least_memory = None
+            for test_name, metrics in analysis['by_test_type'].items():
+                exec_mean = metrics['execution_times']['mean']
+                mem_mean = metrics['memory_usage']['mean']
+                if fastest_test is None or exec_mean < fastest_test[1]:
+                    fastest_test = (test_name, exec_mean)
+                if slowest_test is None or exec_mean > slowest_test[1]:
+                    slowest_test = (test_name, exec_mean)
+                if most_memory is None or mem_mean > most_memory[1]:
+                    most_memory = (test_name, mem_mean)
+                if least_memory is None or mem_mean < least_memory[1]:
+                    least_memory = (test_name, mem_mean)
             
-            report += f"- **Most Memory**: {most_memory[0]} ({most_memory[1]['memory_usage']['mean']:.2f}MB avg)\n"
-            report += f"- **Least Memory**: {least_memory[0]} ({least_memory[1]['memory_usage']['mean']:.2f}MB avg)\n"
+            parts.append(f"- **Fastest Test**: {fastest_test[0]} ({fastest_test[1]:.3f}s avg)\n")
+            parts.append(f"- **Slowest Test**: {slowest_test[0]} ({slowest_test[1]:.3f}s avg)\n")
+            parts.append(f"- **Most Memory**: {most_memory[0]} ({most_memory[1]:.2f}MB avg)\n")
+            parts.append(f"- **Least Memory**: {least_memory[0]} ({least_memory[1]:.2f}MB avg)\n")
         
         # Performance recommendations
-        report += """
+        parts.append("""
 ## Recommendations
 
-"""
+""")
         
         slow_threshold = 1.0  # seconds
         memory_threshold = 50.0  # MB
@@ -209,28 +375,27 @@ class BenchmarkAnalyzer:
             recommendations.append("- ✅ Memory usage appears efficient")
         
         for rec in recommendations:
-            report += rec + "\n"
+            parts.append(rec + "\n")
         
-        return report
+        return ''.join(parts)
     
     def save_analysis(self, analysis, report):
         """Save analysis results and report"""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = time.strftime("%Y%m%d_%H%M%S")
         
         # Save raw analysis data
         analysis_file = self.results_dir.parent / "reports" / f"benchmark_analysis_{timestamp}.json"
         analysis_file.parent.mkdir(exist_ok=True)
         
-        with open(analysis_file, 'w') as f:
-            # Convert sets to lists for JSON serialization
-            analysis_copy = analysis.copy()
-            analysis_copy['summary']['test_types'] = list(analysis['summary']['test_types'])
-            json.dump(analysis_copy, f, indent=2)
+        # Convert sets to lists for JSON serialization, leaving the caller's summary intact
+        analysis_copy = dict(analysis)
+        analysis_copy['summary'] = dict(analysis['summary'])
+        analysis_copy['summary']['test_types'] = list(analysis['summary']['test_types'])
+        analysis_file.write_bytes(_dumps(analysis_copy))
         
         # Save markdown report
         report_file = self.results_dir.parent / "reports" / f"benchmark_report_{timestamp}.md"
-        with open(report_file, 'w', encoding='utf-8') as f:
-            f.write(report)
+        report_file.write_text(report, encoding='utf-8')
         
         print(f"📊 Analysis saved: {analysis_file}")
         print(f"📄 Report saved: {report_file}")
@@ -241,12 +406,12 @@ class BenchmarkAnalyzer:
         """Run complete benchmark analysis"""
         print("🔍 Analyzing benchmark results...")
         
-        data = self.load_benchmark_data()
-        if not data:
+        aggregate = self.load_benchmark_aggregate()
+        if not aggregate.total:
             print("⚠️  No benchmark data found")
             return False
         
-        analysis = self.analyze_performance_trends(data)
+        analysis = self.analyze_performance_trends(aggregate)
         report = self.generate_performance_report(analysis)
         
         analysis_file, report_file = self.save_analysis(analysis, report)
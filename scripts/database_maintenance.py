@@ -6,36 +6,48 @@ Fixes sequence synchronization and other database issues
 
 import sys
 import os
-sys.path.append('src')
+
+# Add src to path (relative to this file, not the working directory)
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src')
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
 
 from causal_memory_core import CausalMemoryCore
 from config import Config
 
 
-def sync_sequence():
-    """Synchronize the event sequence counter with the actual max event ID"""
+def sync_sequence(core=None):
+    """Synchronize the event sequence counter with the actual max event ID
+
+    Uses ``core`` when given, otherwise opens and closes its own.
+    """
     print("🔧 Synchronizing event sequence counter...")
     
-    core = CausalMemoryCore()
+    owns_core = core is None
+    if owns_core:
+        core = CausalMemoryCore()
     try:
-        # Get current max event ID
-        max_id_result = core.conn.execute(
-            'SELECT COALESCE(MAX(event_id), 0) FROM events'
+        # Current max event ID and sequence value in one round-trip
+        max_id, current_seq = core.conn.execute(
+            'SELECT (SELECT COALESCE(MAX(event_id), 0) FROM events), '
+            '(SELECT val FROM _events_seq)'
         ).fetchone()
-        max_id = max_id_result[0] if max_id_result else 0
-        
-        # Get current sequence value
-        seq_result = core.conn.execute(
-            'SELECT val FROM _events_seq'
-        ).fetchone()
-        current_seq = seq_result[0] if seq_result else 1
+        if current_seq is None:
+            current_seq = 1
         
         print(f"📊 Current max event ID: {max_id}")
         print(f"📊 Current sequence value: {current_seq}")
         
-        if current_seq <= max_id:
-            new_seq = max_id + 1
-            core.conn.execute('UPDATE _events_seq SET val = ?', [new_seq])
+        # Single atomic statement: only ever moves the sequence forward, so
+        # an event added since the read above cannot be overtaken
+        row = core.conn.execute(
+            'UPDATE _events_seq '
+            'SET val = GREATEST(val, (SELECT COALESCE(MAX(event_id), 0) + 1 FROM events)) '
+            'RETURNING val'
+        ).fetchone()
+        new_seq = row[0] if row else current_seq
+        
+        if new_seq != current_seq:
             print(f"✅ Sequence updated to: {new_seq}")
         else:
             print("✅ Sequence is already synchronized")
@@ -43,24 +55,25 @@ def sync_sequence():
     except Exception as e:
         print(f"❌ Error during sequence sync: {e}")
     finally:
-        core.close()
+        if owns_core:
+            core.close()
+
 
+def show_database_stats(core=None):
+    """Display current database statistics
 
-def show_database_stats():
-    """Display current database statistics"""
+    Uses ``core`` when given, otherwise opens and closes its own.
+    """
     print("📈 Database Statistics:")
     
-    core = CausalMemoryCore()
+    owns_core = core is None
+    if owns_core:
+        core = CausalMemoryCore()
     try:
-        # Event count
-        event_count = core.conn.execute(
-            'SELECT COUNT(*) FROM events'
-        ).fetchone()[0]
-        
-        # Events with causes
-        causal_events = core.conn.execute(
-            'SELECT COUNT(*) FROM events WHERE cause_id IS NOT NULL'
-        ).fetchone()[0]
+        # Event count and events with causes in a single scan
+        event_count, causal_events = core.conn.execute(
+            'SELECT COUNT(*), COUNT(*) FILTER (WHERE cause_id IS NOT NULL) FROM events'
+        ).fetchone()
         
         # Latest events
         latest_events = core.conn.execute(
@@ -76,14 +89,20 @@ def show_database_stats():
     except Exception as e:
         print(f"❌ Error retrieving stats: {e}")
     finally:
-        core.close()
+        if owns_core:
+            core.close()
+
 
+def test_functionality(core=None):
+    """Test basic add/query functionality
 
-def test_functionality():
-    """Test basic add/query functionality"""
+    Uses ``core`` when given, otherwise opens and closes its own.
+    """
     print("🧪 Testing Core Functionality:")
     
-    core = CausalMemoryCore()
+    owns_core = core is None
+    if owns_core:
+        core = CausalMemoryCore()
     try:
         # Test event addition
         test_event = f"Database maintenance test - {os.urandom(4).hex()}"
@@ -100,7 +119,8 @@ def test_functionality():
     except Exception as e:
         print(f"❌ Functionality test failed: {e}")
     finally:
-        core.close()
+        if owns_core:
+            core.close()
 
 
 def main():
@@ -108,17 +128,23 @@ def main():
     print("🛠️ Causal Memory Core - Database Maintenance")
     print("=" * 50)
     
-    # Show current state
-    show_database_stats()
-    print()
-    
-    # Sync sequence
-    sync_sequence()
-    print()
-    
-    # Test functionality
-    test_functionality()
-    print()
+    # One core for all steps instead of an open/close per step. DuckDB
+    # connections are not meant for concurrent writers, so they stay serial.
+    core = CausalMemoryCore()
+    try:
+        # Show current state
+        show_database_stats(core)
+        print()
+        
+        # Sync sequence
+        sync_sequence(core)
+        print()
+        
+        # Test functionality
+        test_functionality(core)
+        print()
+    finally:
+        core.close()
     
     print("✅ Maintenance complete!")
 
@@ -11,37 +11,55 @@ import numpy as np
 from datetime import datetime
 
 # Add src directory to path
-sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src')
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
 
 from causal_memory_core import CausalMemoryCore, Event
+from config import Config
 import duckdb
 
 
 class DatabaseInspector:
     """Utility for inspecting Causal Memory Core database state"""
     
+    # Rows pulled per fetch when streaming large results
+    FETCH_BATCH_SIZE = 1024
+    
     def __init__(self, db_path: str = 'causal_memory.db'):
         self.db_path = db_path
-        self.conn = duckdb.connect(db_path)
+        # Inspection only reads, so skip the write lock and allow several
+        # inspectors on the same file
+        self.conn = duckdb.connect(db_path, read_only=True)
         
     def close(self):
         """Close database connection"""
         if self.conn:
             self.conn.close()
             
+    def _iter_rows(self, result, batch_size: int = FETCH_BATCH_SIZE):
+        """Yield rows from an executed query in fetchmany batches"""
+        while True:
+            rows = result.fetchmany(batch_size)
+            if not rows:
+                return
+            yield from rows
+            
     def list_all_events(self):
         """List all events in the database"""
         try:
+            total = self.conn.execute("SELECT COUNT(*) FROM events").fetchone()[0]
+            
+            print(f"📊 Total Events: {total}")
+            print("=" * 80)
+            
             result = self.conn.execute("""
                 SELECT event_id, timestamp, effect_text, cause_id, relationship_text
                 FROM events 
                 ORDER BY timestamp ASC
-            """).fetchall()
-            
-            print(f"📊 Total Events: {len(result)}")
-            print("=" * 80)
+            """)
             
-            for row in result:
+            for row in self._iter_rows(result):
                 event_id, timestamp, effect_text, cause_id, relationship_text = row
                 print(f"🔗 Event {event_id}: {effect_text}")
                 print(f"   📅 Time: {timestamp}")
@@ -59,51 +77,64 @@ class DatabaseInspector:
     def show_causal_chains(self):
         """Show all causal chains in the database"""
         try:
-            # Find root events (no cause)
-            roots = self.conn.execute("""
-                SELECT event_id, effect_text FROM events WHERE cause_id IS NULL
+            # Walk every chain in one recursive query. Siblings are ordered by
+            # timestamp through each event's global rank, and sorting on the
+            # rank path yields a depth-first listing of the whole forest.
+            rows = self.conn.execute("""
+                WITH RECURSIVE ranked AS (
+                    SELECT event_id, effect_text, relationship_text, cause_id,
+                           row_number() OVER (ORDER BY timestamp, event_id) AS rank
+                    FROM events
+                ),
+                chain(event_id, effect_text, relationship_text, depth, path) AS (
+                    SELECT event_id, effect_text, NULL::VARCHAR, 0, [rank]
+                    FROM ranked
+                    WHERE cause_id IS NULL
+                    UNION ALL
+                    SELECT r.event_id, r.effect_text, r.relationship_text,
+                           c.depth + 1, list_append(c.path, r.rank)
+                    FROM ranked r JOIN chain c ON r.cause_id = c.event_id
+                )
+                SELECT event_id, effect_text, relationship_text, depth
+                FROM chain
+                ORDER BY path
             """).fetchall()
             
-            print(f"🌳 Causal Chains ({len(roots)} root events)")
+            root_count = sum(1 for row in rows if row[3] == 0)
+            print(f"🌳 Causal Chains ({root_count} root events)")
             print("=" * 80)
             
-            for root_id, root_text in roots:
-                print(f"🎯 Root: {root_text} (ID: {root_id})")
-                self._print_chain_from_root(root_id, indent=1)
-                print()
-                
-        except Exception as e:
-            print(f"❌ Error showing causal chains: {e}")
-            
-    def _print_chain_from_root(self, event_id: int, indent: int = 0):
-        """Recursively print causal chain from a root event"""
-        try:
-            # Find events caused by this event
-            children = self.conn.execute("""
-                SELECT event_id, effect_text, relationship_text
-                FROM events 
-                WHERE cause_id = ?
-                ORDER BY timestamp ASC
-            """, [event_id]).fetchall()
-            
-            for child_id, child_text, relationship in children:
-                prefix = "  " * indent + "⬇️  "
-                print(f"{prefix}{child_text} (ID: {child_id})")
+            first = True
+            for event_id, effect_text, relationship, depth in rows:
+                if depth == 0:
+                    if not first:
+                        print()
+                    first = False
+                    print(f"🎯 Root: {effect_text} (ID: {event_id})")
+                    continue
+                prefix = "  " * depth + "⬇️  "
+                print(f"{prefix}{effect_text} (ID: {event_id})")
                 if relationship:
                     print(f"{prefix}   📝 {relationship}")
-                
-                # Recursively print children of this child
-                self._print_chain_from_root(child_id, indent + 1)
+            if not first:
+                print()
                 
         except Exception as e:
-            print(f"❌ Error printing chain: {e}")
+            print(f"❌ Error showing causal chains: {e}")
             
     def analyze_embeddings(self):
         """Analyze embedding quality and distribution"""
         try:
+            # Per-event stats are computed by DuckDB so the embeddings
+            # themselves never have to be materialized in Python
             result = self.conn.execute("""
-                SELECT event_id, effect_text, embedding
+                SELECT event_id, effect_text,
+                       len(embedding),
+                       sqrt(list_inner_product(embedding, embedding)),
+                       list_avg(embedding),
+                       list_aggregate(embedding, 'stddev_pop')
                 FROM events
+                ORDER BY event_id
             """).fetchall()
             
             if not result:
@@ -113,72 +144,74 @@ class DatabaseInspector:
             print(f"🧮 Embedding Analysis ({len(result)} events)")
             print("=" * 80)
             
-            embeddings = []
-            for event_id, effect_text, embedding in result:
-                emb_array = np.array(embedding)
-                embeddings.append(emb_array)
-                
+            for event_id, effect_text, dimension, norm, mean, std in result:
                 print(f"🔗 Event {event_id}: {effect_text}")
-                print(f"   📏 Dimension: {len(emb_array)}")
-                print(f"   📊 Norm: {np.linalg.norm(emb_array):.3f}")
-                print(f"   📈 Mean: {np.mean(emb_array):.3f}")
-                print(f"   📉 Std: {np.std(emb_array):.3f}")
+                print(f"   📏 Dimension: {dimension}")
+                print(f"   📊 Norm: {norm:.3f}")
+                print(f"   📈 Mean: {mean:.3f}")
+                print(f"   📉 Std: {std:.3f}")
                 print()
                 
-            if len(embeddings) > 1:
+            if len(result) > 1:
                 print("🔄 Pairwise Similarities:")
                 print("-" * 40)
                 
-                for i in range(len(embeddings)):
-                    for j in range(i + 1, len(embeddings)):
-                        similarity = self._cosine_similarity(embeddings[i], embeddings[j])
-                        event_i_text = result[i][1][:30] + "..." if len(result[i][1]) > 30 else result[i][1]
-                        event_j_text = result[j][1][:30] + "..." if len(result[j][1]) > 30 else result[j][1]
-                        print(f"  {i+1} ↔ {j+1}: {similarity:.3f} | {event_i_text} ↔ {event_j_text}")
+                # Self-join scored in DuckDB's vectorized engine; a pair
+                # involving a zero vector scores 0 rather than NaN
+                pairs = self.conn.execute("""
+                    WITH numbered AS (
+                        SELECT row_number() OVER (ORDER BY event_id) AS idx,
+                               effect_text, embedding,
+                               list_inner_product(embedding, embedding) = 0 AS is_zero
+                        FROM events
+                    )
+                    SELECT a.idx, b.idx,
+                           CASE WHEN a.is_zero OR b.is_zero THEN 0.0
+                                ELSE list_cosine_similarity(a.embedding, b.embedding) END
+                    FROM numbered a JOIN numbered b ON a.idx < b.idx
+                    ORDER BY a.idx, b.idx
+                """)
+                texts = [text[:30] + "..." if len(text) > 30 else text for _, text, *_ in result]
+                
+                for i, j, similarity in self._iter_rows(pairs):
+                    print(f"  {i} ↔ {j}: {similarity:.3f} | {texts[i-1]} ↔ {texts[j-1]}")
                         
         except Exception as e:
             print(f"❌ Error analyzing embeddings: {e}")
             
-    def _cosine_similarity(self, a: np.ndarray, b: np.ndarray) -> float:
-        """Calculate cosine similarity between two vectors"""
-        norm_a = np.linalg.norm(a)
-        norm_b = np.linalg.norm(b)
-        if norm_a == 0 or norm_b == 0:
-            return 0.0
-        return float(np.dot(a, b) / (norm_a * norm_b))
-        
     def test_similarity_search(self, query_text: str):
         """Test similarity search for a given query"""
+        memory_core = None
         try:
             print(f"🔍 Testing similarity search for: '{query_text}'")
             print("=" * 80)
             
-            # Create a temporary memory core to use embedder
-            from config import Config
+            # Create a temporary memory core to use embedder. It needs a
+            # read-write connection (get_context records accesses), and DuckDB
+            # will not mix that with our read-only one in a single process, so
+            # use the core's connection until it is closed.
+            self.conn.close()
+            self.conn = None
             memory_core = CausalMemoryCore(db_path=self.db_path)
             
             # Generate query embedding
-            query_embedding = memory_core.embedder.encode(query_text).tolist()
-            query_array = np.array(query_embedding)
+            query_array = np.asarray(memory_core.embedder.encode(query_text), dtype=np.float64)
+            query_norm = np.linalg.norm(query_array)
             
-            print(f"📏 Query embedding dimension: {len(query_embedding)}")
-            print(f"📊 Query embedding norm: {np.linalg.norm(query_array):.3f}")
+            print(f"📏 Query embedding dimension: {len(query_array)}")
+            print(f"📊 Query embedding norm: {query_norm:.3f}")
             print()
             
-            # Get all events and calculate similarities
-            result = self.conn.execute("""
-                SELECT event_id, effect_text, embedding
+            # Rank every event inside DuckDB; only ids, texts and scores
+            # come back to Python
+            similarities = memory_core.conn.execute("""
+                SELECT
+                    CASE WHEN ? = 0 OR list_inner_product(embedding, embedding) = 0 THEN 0.0
+                         ELSE list_cosine_similarity(embedding, ?::DOUBLE[]) END AS similarity,
+                    event_id, effect_text
                 FROM events
-            """).fetchall()
-            
-            similarities = []
-            for event_id, effect_text, embedding in result:
-                event_array = np.array(embedding)
-                similarity = self._cosine_similarity(query_array, event_array)
-                similarities.append((similarity, event_id, effect_text))
-                
-            # Sort by similarity
-            similarities.sort(reverse=True)
+                ORDER BY similarity DESC, event_id DESC
+            """, [float(query_norm), query_array.tolist()]).fetchall()
             
             print(f"🎯 Similarity Rankings (threshold: {Config.SIMILARITY_THRESHOLD}):")
             print("-" * 60)
@@ -193,10 +226,13 @@ class DatabaseInspector:
             context = memory_core.get_context(query_text)
             print(context)
             
-            memory_core.close()
-            
         except Exception as e:
             print(f"❌ Error testing similarity search: {e}")
+        finally:
+            if memory_core is not None:
+                memory_core.close()
+            if self.conn is None:
+                self.conn = duckdb.connect(self.db_path, read_only=True)
             
     def database_stats(self):
         """Show database statistics"""
@@ -204,12 +240,20 @@ class DatabaseInspector:
             print("📈 Database Statistics")
             print("=" * 50)
             
-            # Event count
-            total_events = self.conn.execute("SELECT COUNT(*) FROM events").fetchone()[0]
+            # All statistics in one pass over the table
+            total_events, root_events, first_ts, last_ts, broken_chains = self.conn.execute("""
+                SELECT
+                    COUNT(*),
+                    COUNT(*) FILTER (WHERE cause_id IS NULL),
+                    MIN(timestamp),
+                    MAX(timestamp),
+                    COUNT(*) FILTER (
+                        WHERE cause_id IS NOT NULL
+                        AND cause_id NOT IN (SELECT event_id FROM events)
+                    )
+                FROM events
+            """).fetchone()
             print(f"Total Events: {total_events}")
-            
-            # Root events (no cause)
-            root_events = self.conn.execute("SELECT COUNT(*) FROM events WHERE cause_id IS NULL").fetchone()[0]
             print(f"Root Events: {root_events}")
             
             # Events with causes
@@ -219,21 +263,9 @@ class DatabaseInspector:
             if total_events > 0:
                 print(f"Causality Ratio: {caused_events/total_events:.1%}")
                 
-            # Date range
-            date_range = self.conn.execute("""
-                SELECT MIN(timestamp), MAX(timestamp) FROM events
-            """).fetchone()
-            
-            if date_range[0]:
-                print(f"Date Range: {date_range[0]} to {date_range[1]}")
+            if first_ts:
+                print(f"Date Range: {first_ts} to {last_ts}")
                 
-            # Check for broken chains
-            broken_chains = self.conn.execute("""
-                SELECT COUNT(*) FROM events e1
-                WHERE e1.cause_id IS NOT NULL
-                AND NOT EXISTS (SELECT 1 FROM events e2 WHERE e2.event_id = e1.cause_id)
-            """).fetchone()[0]
-            
             if broken_chains > 0:
                 print(f"⚠️  Broken Chains: {broken_chains}")
             else:
@@ -1,18 +1,20 @@
 
 import duckdb
-import pandas as pd
 
 # Connect to the database
 con = duckdb.connect('causal_memory.db')
 
-# Query the events table
-df = con.execute("SELECT * FROM events").fetchdf()
+# Query the events table, slicing the embedding in SQL so only the first
+# 5 elements of each vector leave DuckDB
+rows = con.execute(
+    "SELECT event_id, effect_text, embedding[1:5] AS embedding_head FROM events"
+).fetchall()
 
 # Print the effect_text and the first 5 elements of each embedding
-for index, row in df.iterrows():
-    print(f"Event ID: {row['event_id']}")
-    print(f"Effect Text: {row['effect_text']}")
-    print(f"Embedding: {row['embedding'][:5]}")
+for event_id, effect_text, embedding_head in rows:
+    print(f"Event ID: {event_id}")
+    print(f"Effect Text: {effect_text}")
+    print(f"Embedding: {embedding_head}")
 
 # Close the connection
 con.close()
@@ -4,21 +4,29 @@ Comprehensive Test Runner for Causal Memory Core
 Runs functionality tests, performance benchmarks, and generates detailed reports
 """
 
+import hashlib
 import os
 import sys
 import subprocess
-import json
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 import argparse
 
+import _deps
+from _jsonio import dumps as _dumps, loads as _loads
+
+
 class ComprehensiveTestRunner:
     """Manages comprehensive testing including functionality and performance"""
     
     def __init__(self, project_root=None):
         self.project_root = Path(project_root) if project_root else Path(__file__).parent
         self.results_dir = self.project_root / "test_results"
+        # Children write UTF-8 whatever the console code page, so log files
+        # decode as UTF-8 (see read_log_tail) and emoji output cannot fail
+        self.env = {**os.environ, 'PYTHONUTF8': '1'}
         self.ensure_directories()
         
     def ensure_directories(self):
@@ -34,27 +42,55 @@ class ComprehensiveTestRunner:
         for dir_path in dirs:
             dir_path.mkdir(exist_ok=True)
     
-    def run_command(self, cmd, cwd=None, capture_output=True):
-        """Run a command and return result"""
+    def run_command(self, cmd, cwd=None, capture_output=True, log=print, log_file=None):
+        """Run a command and return result
+
+        Progress lines go through ``log`` so concurrent callers can buffer
+        them instead of interleaving on the console. With ``log_file`` the
+        command's stdout and stderr are written straight to that file
+        instead of being captured in memory.
+        """
         if cwd is None:
             cwd = self.project_root
             
-        print(f"🔧 Running: {' '.join(cmd)}")
+        log(f"🔧 Running: {' '.join(cmd)}")
         start_time = time.time()
         
-        result = subprocess.run(
-            cmd,
-            cwd=cwd,
-            capture_output=capture_output,
-            text=True,
-            timeout=600  # 10 minute timeout
-        )
+        if log_file is not None:
+            with open(log_file, 'wb') as out:
+                result = subprocess.run(
+                    cmd,
+                    cwd=cwd,
+                    stdout=out,
+                    stderr=subprocess.STDOUT,
+                    env=self.env,
+                    timeout=600  # 10 minute timeout
+                )
+        else:
+            result = subprocess.run(
+                cmd,
+                cwd=cwd,
+                capture_output=capture_output,
+                text=True,
+                env=self.env,
+                timeout=600  # 10 minute timeout
+            )
         
         duration = time.time() - start_time
-        print(f"⏱️  Completed in {duration:.2f}s (exit code: {result.returncode})")
+        log(f"⏱️  Completed in {duration:.2f}s (exit code: {result.returncode})")
         
         return result, duration
     
+    # Bytes of a command's log kept in the report for quick diagnosis
+    LOG_TAIL_BYTES = 2000
+    
+    def read_log_tail(self, log_file):
+        """Return the last LOG_TAIL_BYTES of a command log as text"""
+        with open(log_file, 'rb') as f:
+            f.seek(0, os.SEEK_END)
+            f.seek(max(f.tell() - self.LOG_TAIL_BYTES, 0))
+            return f.read().decode('utf-8', errors='replace')
+    
     def check_dependencies(self):
         """Check if required dependencies are available"""
         print("\n" + "="*60)
@@ -70,8 +106,7 @@ class ComprehensiveTestRunner:
         available_packages = []
         
         for package in required_packages:
-            result, _ = self.run_command([sys.executable, '-c', f'import {package}'])
-            if result.returncode == 0:
+            if _deps.probe(package):
                 available_packages.append(package)
                 print(f"✅ {package}")
             else:
@@ -86,7 +121,7 @@ class ComprehensiveTestRunner:
             return True
             
         print(f"\n📦 Installing dependencies: {', '.join(packages)}")
-        cmd = [sys.executable, '-m', 'pip', 'install'] + packages + ['--user']
+        cmd = _deps.PIP_INSTALL + packages + ['--user']
         result, duration = self.run_command(cmd, capture_output=False)
         
         success = result.returncode == 0
@@ -111,36 +146,55 @@ class ComprehensiveTestRunner:
             ('Realistic Scenarios', ['tests/e2e/test_realistic_scenarios_e2e.py'])
         ]
         
-        functionality_results = {}
-        
-        for suite_name, test_paths in test_suites:
-            print(f"\n🔬 Running {suite_name}...")
+        def run_suite(suite_name, test_path):
+            lines = [f"\n🔬 Running {suite_name}..."]
+            slug = suite_name.lower().replace(" ", "_")
+            # No .pytest_cache writes: nothing here uses --lf/--ff, and the
+            # suites run as concurrent pytest processes
+            cmd = [
+                sys.executable, '-m', 'pytest', 
+                '-p', 'no:cacheprovider',
+                test_path, 
+                '-v', 
+                '--tb=short',
+                f'--junitxml={self.results_dir}/reports/{slug}_results.xml'
+            ]
             
-            for test_path in test_paths:
-                cmd = [
-                    sys.executable, '-m', 'pytest', 
-                    test_path, 
-                    '-v', 
-                    '--tb=short',
-                    f'--junitxml={self.results_dir}/reports/{suite_name.lower().replace(" ", "_")}_results.xml'
-                ]
-                
-                result, duration = self.run_command(cmd)
-                
-                functionality_results[f"{suite_name}_{test_path}"] = {
-                    'suite_name': suite_name,
-                    'test_path': test_path,
-                    'success': result.returncode == 0,
-                    'duration': duration,
-                    'stdout': result.stdout,
-                    'stderr': result.stderr
-                }
-                
-                if result.returncode == 0:
-                    print(f"✅ {suite_name} passed ({duration:.1f}s)")
-                else:
-                    print(f"❌ {suite_name} failed ({duration:.1f}s)")
-                    print(f"Error output: {result.stderr[:200]}...")
+            log_file = self.results_dir / "logs" / f"{slug}.log"
+            result, duration = self.run_command(cmd, log=lines.append, log_file=log_file)
+            output_tail = self.read_log_tail(log_file)
+            
+            if result.returncode == 0:
+                lines.append(f"✅ {suite_name} passed ({duration:.1f}s)")
+            else:
+                lines.append(f"❌ {suite_name} failed ({duration:.1f}s)")
+                lines.append(f"Error output: ...{output_tail[-200:]}")
+            
+            return {
+                'suite_name': suite_name,
+                'test_path': test_path,
+                'success': result.returncode == 0,
+                'duration': duration,
+                'log_file': str(log_file),
+                'output_tail': output_tail
+            }, lines
+        
+        jobs = [
+            (suite_name, test_path)
+            for suite_name, test_paths in test_suites
+            for test_path in test_paths
+        ]
+        
+        # Every suite is its own pytest process writing its own JUnit file,
+        # so they run side by side; each suite's progress is printed as one
+        # block, in declared order
+        functionality_results = {}
+        with ThreadPoolExecutor(max_workers=len(jobs)) as executor:
+            futures = [executor.submit(run_suite, *job) for job in jobs]
+            for (suite_name, test_path), future in zip(jobs, futures):
+                suite_result, lines = future.result()
+                print('\n'.join(lines))
+                functionality_results[f"{suite_name}_{test_path}"] = suite_result
         
         return functionality_results
     
@@ -152,26 +206,29 @@ class ComprehensiveTestRunner:
         
         benchmark_cmd = [
             sys.executable, '-m', 'pytest',
+            '-p', 'no:cacheprovider',
             'tests/e2e/test_performance_benchmarks.py',
             '-v', '-s',
             '--tb=short',
             f'--junitxml={self.results_dir}/reports/performance_benchmarks.xml'
         ]
         
-        result, duration = self.run_command(benchmark_cmd)
+        log_file = self.results_dir / "logs" / "performance_benchmarks.log"
+        result, duration = self.run_command(benchmark_cmd, log_file=log_file)
+        output_tail = self.read_log_tail(log_file)
         
         benchmark_results = {
             'success': result.returncode == 0,
             'duration': duration,
-            'stdout': result.stdout,
-            'stderr': result.stderr
+            'log_file': str(log_file),
+            'output_tail': output_tail
         }
         
         if result.returncode == 0:
             print(f"✅ Performance benchmarks completed ({duration:.1f}s)")
         else:
             print(f"❌ Performance benchmarks failed ({duration:.1f}s)")
-            print(f"Error output: {result.stderr[:200]}...")
+            print(f"Error output: ...{output_tail[-200:]}")
         
         return benchmark_results
     
@@ -180,66 +237,169 @@ class ComprehensiveTestRunner:
         print("\n📈 Analyzing benchmark results...")
         
         benchmark_dir = self.results_dir / "benchmarks"
-        if not benchmark_dir.exists():
-            print("⚠️  No benchmark results found")
-            return {}
         
-        # Get today's benchmark files
+        # Get today's benchmark files; one stat() answers both whether the
+        # file exists and what the cache check below needs
         today = datetime.now().strftime('%Y%m%d')
         daily_file = benchmark_dir / f"daily_benchmarks_{today}.jsonl"
         
-        if not daily_file.exists():
-            print("⚠️  No benchmark results for today")
+        try:
+            stat = daily_file.stat()
+        except FileNotFoundError:
+            if benchmark_dir.is_dir():
+                print("⚠️  No benchmark results for today")
+            else:
+                print("⚠️  No benchmark results found")
             return {}
         
-        # Parse benchmark results
-        results = []
-        with open(daily_file, 'r') as f:
-            for line in f:
-                results.append(json.loads(line.strip()))
+        # Stream the file, keeping only running totals per test type. The
+        # totals and the byte offset they cover are cached next to the
+        # summary, so later runs only parse lines appended since then.
+        cache_file = self.results_dir / "reports" / f"benchmark_summary_{today}.cache.json"
+        state = self.load_benchmark_cache(cache_file, daily_file, stat)
+        try:
+            state = self.scan_benchmark_file(daily_file, state)
+        except ValueError:
+            if not state['offset']:
+                raise
+            # The cached offset is not a record boundary of this file after
+            # all; start over rather than report a mix of two files
+            state = self.scan_benchmark_file(daily_file, self.empty_benchmark_cache(stat))
+        cache_file.write_bytes(_dumps(state))
+        accum = state['accum']
+        total = state['total']
         
         # Generate summary statistics
         summary = {
-            'total_benchmarks': len(results),
+            'total_benchmarks': total,
             'timestamp': datetime.now(timezone.utc).isoformat(),
-            'benchmarks_by_type': {},
-            'performance_summary': {}
-        }
-        
-        # Group by test type
-        for result in results:
-            test_name = result['test_name']
-            if test_name not in summary['benchmarks_by_type']:
-                summary['benchmarks_by_type'][test_name] = []
-            summary['benchmarks_by_type'][test_name].append(result)
-        
-        # Calculate performance metrics
-        for test_type, test_results in summary['benchmarks_by_type'].items():
-            execution_times = [r['execution_time_seconds'] for r in test_results]
-            memory_deltas = [r.get('memory_delta_mb', 0) for r in test_results]
-            
-            summary['performance_summary'][test_type] = {
-                'count': len(test_results),
-                'avg_execution_time': sum(execution_times) / len(execution_times),
-                'max_execution_time': max(execution_times),
-                'avg_memory_delta': sum(memory_deltas) / len(memory_deltas),
-                'max_memory_delta': max(memory_deltas)
+            'performance_summary': {
+                test_type: {
+                    'count': a['count'],
+                    'avg_execution_time': a['sum_time'] / a['count'],
+                    'max_execution_time': a['max_time'],
+                    'avg_memory_delta': a['sum_memory'] / a['count'],
+                    'max_memory_delta': a['max_memory']
+                }
+                for test_type, a in accum.items()
             }
+        }
         
         # Save summary
         summary_file = self.results_dir / "reports" / f"benchmark_summary_{today}.json"
-        with open(summary_file, 'w') as f:
-            json.dump(summary, f, indent=2)
+        with open(summary_file, 'wb') as f:
+            f.write(_dumps(summary))
         
-        print(f"📊 Analyzed {len(results)} benchmark results")
+        print(f"📊 Analyzed {total} benchmark results")
         return summary
     
+    @staticmethod
+    def empty_benchmark_cache(stat):
+        """Return benchmark cache state covering none of a daily file"""
+        return {'ino': stat.st_ino, 'offset': 0, 'total': 0, 'accum': {},
+                'tail_len': 0, 'tail_sha1': ''}
+    
+    @classmethod
+    def load_benchmark_cache(cls, cache_file, daily_file, stat):
+        """Return cached benchmark totals still valid for a daily file
+
+        The cache is ignored when it is missing, unreadable or incomplete,
+        when the daily file has been replaced (new inode) or has shrunk, or
+        when the last line it consumed is no longer found just before its
+        offset, i.e. whenever the file may not still start with the bytes
+        the cached totals were built from.
+        """
+        empty = cls.empty_benchmark_cache(stat)
+        try:
+            state = _loads(cache_file.read_bytes())
+        except (OSError, ValueError):
+            return empty
+        if not isinstance(state, dict) or not empty.keys() <= state.keys():
+            return empty
+        if state['ino'] != stat.st_ino or state['offset'] > stat.st_size:
+            return empty
+        if state['offset']:
+            tail_len = state['tail_len']
+            if not 0 < tail_len <= state['offset']:
+                return empty
+            with open(daily_file, 'rb') as f:
+                f.seek(state['offset'] - tail_len)
+                tail = f.read(tail_len)
+            if hashlib.sha1(tail).hexdigest() != state['tail_sha1']:
+                return empty
+        return state
+    
+    @classmethod
+    def scan_benchmark_file(cls, daily_file, state):
+        """Fold the records after ``state['offset']`` into ``state``
+
+        Returns the updated state; raises ValueError when a line is not
+        valid JSON.
+        """
+        accum = state['accum']
+        total = state['total']
+        offset = state['offset']
+        tail = None
+        with open(daily_file, 'rb', buffering=1 << 20) as f:
+            f.seek(offset)
+            for line in f:
+                if line.endswith(b'\n'):
+                    record = _loads(line) if line.strip() else None
+                else:
+                    # Last line has no newline: count it if it is a complete
+                    # record, else it is still being written; pick it up
+                    # next run
+                    try:
+                        record = _loads(line)
+                    except ValueError:
+                        break
+                offset += len(line)
+                tail = line
+                if record is not None:
+                    cls.accumulate_benchmark(accum, record)
+                    total += 1
+        state = dict(state, accum=accum, total=total, offset=offset)
+        if tail is not None:
+            state['tail_len'] = len(tail)
+            state['tail_sha1'] = hashlib.sha1(tail).hexdigest()
+        return state
+    
+    @staticmethod
+    def accumulate_benchmark(accum, record):
+        """Fold one benchmark record into the per-test-type running totals"""
+        execution_time = record['execution_time_seconds']
+        memory_delta = record.get('memory_delta_mb', 0)
+        a = accum.get(record['test_name'])
+        if a is None:
+            accum[record['test_name']] = {
+                'count': 1,
+                'sum_time': execution_time,
+                'max_time': execution_time,
+                'sum_memory': memory_delta,
+                'max_memory': memory_delta
+            }
+            return
+        a['count'] += 1
+        a['sum_time'] += execution_time
+        a['sum_memory'] += memory_delta
+        if execution_time > a['max_time']:
+            a['max_time'] = execution_time
+        if memory_delta > a['max_memory']:
+            a['max_memory'] = memory_delta
+    
     def generate_test_report(self, functionality_results, benchmark_results, benchmark_summary):
         """Generate comprehensive test report"""
         print("\n📝 Generating comprehensive test report...")
         
         timestamp = datetime.now(timezone.utc)
         
+        # Tally the suites in one pass
+        passed_suites = 0
+        total_duration = 0.0
+        for r in functionality_results.values():
+            passed_suites += r['success']
+            total_duration += r['duration']
+        
         report = {
             'test_run_info': {
                 'timestamp': timestamp.isoformat(),
@@ -250,9 +410,9 @@ class ComprehensiveTestRunner:
             'functionality_tests': {
                 'summary': {
                     'total_suites': len(functionality_results),
-                    'passed_suites': sum(1 for r in functionality_results.values() if r['success']),
-                    'failed_suites': sum(1 for r in functionality_results.values() if not r['success']),
-                    'total_duration': sum(r['duration'] for r in functionality_results.values())
+                    'passed_suites': passed_suites,
+                    'failed_suites': len(functionality_results) - passed_suites,
+                    'total_duration': total_duration
                 },
                 'detailed_results': functionality_results
             },
@@ -285,12 +445,13 @@ class ComprehensiveTestRunner:
             report['recommendations'].append("✅ All tests passed with good performance")
         
         # Save comprehensive report
-        report_file = self.results_dir / "reports" / f"comprehensive_report_{timestamp.strftime('%Y%m%d_%H%M%S')}.json"
-        with open(report_file, 'w') as f:
-            json.dump(report, f, indent=2)
+        file_stamp = timestamp.strftime('%Y%m%d_%H%M%S')
+        report_file = self.results_dir / "reports" / f"comprehensive_report_{file_stamp}.json"
+        with open(report_file, 'wb') as f:
+            f.write(_dumps(report))
         
         # Save human-readable summary
-        summary_file = self.results_dir / "reports" / f"test_summary_{timestamp.strftime('%Y%m%d_%H%M%S')}.md"
+        summary_file = self.results_dir / "reports" / f"test_summary_{file_stamp}.md"
         with open(summary_file, 'w', encoding='utf-8') as f:
             f.write(self.format_report_markdown(report))
         
@@ -301,7 +462,7 @@ class ComprehensiveTestRunner:
     
     def format_report_markdown(self, report):
         """Format test report as markdown"""
-        md = f"""# Causal Memory Core - Test Report
+        parts = [f"""# Causal Memory Core - Test Report
 
 ## Test Run Information
 - **Timestamp**: {report['test_run_info']['timestamp']}
@@ -318,29 +479,31 @@ class ComprehensiveTestRunner:
 - **Benchmark Success**: {'✅ Passed' if report['performance_benchmarks']['summary']['success'] else '❌ Failed'}
 - **Benchmark Duration**: {report['performance_benchmarks']['summary']['duration']:.2f}s
 
-"""
+"""]
         
         if report['performance_benchmarks']['benchmark_analysis'].get('performance_summary'):
-            md += "## Performance Metrics\n\n"
+            parts.append("## Performance Metrics\n\n")
             for test_type, metrics in report['performance_benchmarks']['benchmark_analysis']['performance_summary'].items():
-                md += f"### {test_type}\n"
-                md += f"- **Runs**: {metrics['count']}\n"
-                md += f"- **Avg Execution**: {metrics['avg_execution_time']:.3f}s\n"
-                md += f"- **Max Execution**: {metrics['max_execution_time']:.3f}s\n"
-                md += f"- **Avg Memory Delta**: {metrics['avg_memory_delta']:.2f}MB\n\n"
-        
-        md += "## Recommendations\n\n"
-        for rec in report['recommendations']:
-            md += f"- {rec}\n"
-        
-        return md
+                parts.append(
+                    f"### {test_type}\n"
+                    f"- **Runs**: {metrics['count']}\n"
+                    f"- **Avg Execution**: {metrics['avg_execution_time']:.3f}s\n"
+                    f"- **Max Execution**: {metrics['max_execution_time']:.3f}s\n"
+                    f"- **Avg Memory Delta**: {metrics['avg_memory_delta']:.2f}MB\n\n"
+                )
+        
+        parts.append("## Recommendations\n\n")
+        parts.extend(f"- {rec}\n" for rec in report['recommendations'])
+        
+        return ''.join(parts)
     
     def update_development_journal(self, report):
         """Update the development journal with test results"""
         journal_file = self.results_dir / "benchmarking_journal.md"
         
-        timestamp = datetime.now(timezone.utc)
-        entry = f"""
+        # Same instant as the report, so journal and report files line up
+        timestamp = datetime.fromisoformat(report['test_run_info']['timestamp'])
+        parts = [f"""
 ---
 
 ## {timestamp.strftime('%Y-%m-%d %H:%M UTC')} - Test Run Results
@@ -350,23 +513,23 @@ class ComprehensiveTestRunner:
 - **Performance Benchmarks**: {'✅ Success' if report['performance_benchmarks']['summary']['success'] else '❌ Failed'}
 - **Total Test Duration**: {report['functionality_tests']['summary']['total_duration'] + report['performance_benchmarks']['summary']['duration']:.1f}s
 
-"""
+"""]
         
         if report['performance_benchmarks']['benchmark_analysis'].get('performance_summary'):
-            entry += "### Performance Highlights\n"
-            for test_type, metrics in report['performance_benchmarks']['benchmark_analysis']['performance_summary'].items():
-                entry += f"- **{test_type}**: {metrics['avg_execution_time']:.3f}s avg, {metrics['count']} runs\n"
-            entry += "\n"
-        
-        entry += "### Key Findings\n"
-        for rec in report['recommendations']:
-            entry += f"- {rec}\n"
-        
-        entry += "\n"
-        
-        # Append to journal
+            parts.append("### Performance Highlights\n")
+            parts.extend(
+                f"- **{test_type}**: {metrics['avg_execution_time']:.3f}s avg, {metrics['count']} runs\n"
+                for test_type, metrics in report['performance_benchmarks']['benchmark_analysis']['performance_summary'].items()
+            )
+            parts.append("\n")
+        
+        parts.append("### Key Findings\n")
+        parts.extend(f"- {rec}\n" for rec in report['recommendations'])
+        parts.append("\n")
+        
+        # Append to journal in one write
         with open(journal_file, 'a', encoding='utf-8') as f:
-            f.write(entry)
+            f.write(''.join(parts))
         
         print(f"📓 Updated development journal: {journal_file}")
     
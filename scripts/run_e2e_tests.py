@@ -10,6 +10,8 @@ import subprocess
 import argparse
 from pathlib import Path
 
+import _deps
+
 def run_command(cmd, cwd=None):
     """Run a command and return the result"""
     if cwd is None:
@@ -19,17 +21,23 @@ def run_command(cmd, cwd=None):
     result = subprocess.run(cmd, cwd=cwd, capture_output=True, text=True)
     return result
 
+def stream_command(cmd, cwd=None):
+    """Run a command with its output going straight to this console
+
+    The child inherits stdout/stderr, so test output appears as it is
+    produced and is never buffered in this process. Returns the exit code.
+    """
+    if cwd is None:
+        cwd = Path(__file__).parent
+    
+    print(f"Running: {' '.join(cmd)}")
+    sys.stdout.flush()
+    return subprocess.run(cmd, cwd=cwd).returncode
+
 def check_dependencies():
     """Check if required dependencies are installed"""
     required_packages = ['pytest', 'duckdb', 'numpy']
-    missing_packages = []
-    
-    for package in required_packages:
-        result = run_command([sys.executable, '-c', f'import {package}'])
-        if result.returncode != 0:
-            missing_packages.append(package)
-    
-    return missing_packages
+    return _deps.missing(required_packages)
 
 def install_dependencies(packages):
     """Install missing dependencies"""
@@ -37,7 +45,7 @@ def install_dependencies(packages):
         return True
     
     print(f"Installing missing dependencies: {', '.join(packages)}")
-    cmd = [sys.executable, '-m', 'pip', 'install'] + packages
+    cmd = _deps.PIP_INSTALL + packages
     result = run_command(cmd)
     
     if result.returncode != 0:
@@ -53,14 +61,9 @@ def run_unit_tests():
     print("RUNNING UNIT TESTS")
     print("="*60)
     
-    cmd = [sys.executable, '-m', 'pytest', 'tests/test_memory_core.py', '-v']
-    result = run_command(cmd)
-    
-    print(result.stdout)
-    if result.stderr:
-        print("STDERR:", result.stderr)
-    
-    return result.returncode == 0
+    # The runners never use --lf/--ff, so skip writing .pytest_cache
+    cmd = [sys.executable, '-m', 'pytest', '-p', 'no:cacheprovider', 'tests/test_memory_core.py', '-v']
+    return stream_command(cmd) == 0
 
 def run_e2e_tests(test_type=None):
     """Run E2E tests"""
@@ -75,14 +78,8 @@ def run_e2e_tests(test_type=None):
         test_path = "tests/e2e/"
         print("Running all E2E tests")
     
-    cmd = [sys.executable, '-m', 'pytest', test_path, '-v']
-    result = run_command(cmd)
-    
-    print(result.stdout)
-    if result.stderr:
-        print("STDERR:", result.stderr)
-    
-    return result.returncode == 0
+    cmd = [sys.executable, '-m', 'pytest', '-p', 'no:cacheprovider', test_path, '-v']
+    return stream_command(cmd) == 0
 
 def demonstrate_scenarios():
     """Demonstrate the test scenarios we've created"""
@@ -23,6 +23,11 @@ from slowapi.util import get_remote_address
 from slowapi.errors import RateLimitExceeded
 
 from src.causal_memory_core import CausalMemoryCore
+from config import load_env
+
+# Module-level settings below read os.environ directly; load .env first
+load_env()
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
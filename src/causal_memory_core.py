@@ -3,6 +3,7 @@ from __future__ import annotations
 """Causal Memory Core v1.2.0 — vitality-based forgetting algorithm."""
 
 import atexit
+import itertools
 import logging
 import os
 import sys
@@ -37,10 +38,11 @@ logger = logging.getLogger(__name__)
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 try:
-    from config import Config
+    from config import Config, load_env
 except ImportError:
     import config as config_mod
     Config = config_mod.Config
+    load_env = config_mod.load_env
 
 
 @dataclass
@@ -53,6 +55,26 @@ class Event:
     relationship_text: Optional[str] = None
 
 
+def _cosine_similarities(rows, embedding: List[float]) -> np.ndarray:
+    """Cosine similarity of ``embedding`` to the embedding (column 3) of each row.
+
+    The row embeddings are copied straight into one contiguous matrix and
+    scored with a single matrix-vector product. Rows with a zero-norm
+    embedding (or a zero query) get NaN.
+    """
+    query = np.asarray(embedding, dtype=float)
+    dim = len(rows[0][3])
+    matrix = np.fromiter(
+        itertools.chain.from_iterable(row[3] for row in rows),
+        dtype=float,
+        count=len(rows) * dim,
+    ).reshape(len(rows), dim)
+    denoms = np.linalg.norm(matrix, axis=1) * np.linalg.norm(query)
+    sims = np.full(len(rows), np.nan)
+    np.divide(matrix @ query, denoms, out=sims, where=denoms != 0)
+    return sims
+
+
 class CausalMemoryCore:
     def __init__(
         self,
@@ -172,6 +194,7 @@ class CausalMemoryCore:
         """)
 
     def _initialize_llm(self):
+        load_env()
         api_key = os.getenv("OPENAI_API_KEY")
         base_url = os.getenv("OPENAI_BASE_URL")
         if base_url:
@@ -198,21 +221,69 @@ class CausalMemoryCore:
     def _initialize_embedder(self) -> SentenceTransformer:
         return SentenceTransformer(self.embedding_model_name)
 
+    def _store_embedding(self, text: str, embedding: List[float]) -> None:
+        self._embedding_cache[text] = embedding
+        if len(self._embedding_cache) > self._embedding_cache_size:
+            self._embedding_cache.popitem(last=False)
+
     def _get_cached_embedding(self, text: str) -> List[float]:
         if text in self._embedding_cache:
             self._embedding_cache.move_to_end(text)
             return self._embedding_cache[text]
         encoded = self.embedder.encode(text)
         embedding = encoded.tolist() if hasattr(encoded, "tolist") else list(encoded)
-        self._embedding_cache[text] = embedding
-        if len(self._embedding_cache) > self._embedding_cache_size:
-            self._embedding_cache.popitem(last=False)
+        self._store_embedding(text, embedding)
         return embedding
 
+    def _get_cached_embeddings(self, texts: List[str]) -> List[List[float]]:
+        """Embed several texts, encoding all cache misses in one batched call."""
+        found: dict[str, List[float]] = {}
+        missing: List[str] = []
+        for text in dict.fromkeys(texts):
+            if text in self._embedding_cache:
+                self._embedding_cache.move_to_end(text)
+                found[text] = self._embedding_cache[text]
+            else:
+                missing.append(text)
+        if missing:
+            for text, encoded in zip(missing, self.embedder.encode(missing)):
+                embedding = encoded.tolist() if hasattr(encoded, "tolist") else list(encoded)
+                found[text] = embedding
+                self._store_embedding(text, embedding)
+        return [found[text] for text in texts]
+
     def add_event(self, effect_text: str) -> None:
         if not effect_text or not effect_text.strip():
             raise ValueError("effect_text cannot be empty")
         embedding = self._get_cached_embedding(effect_text)
+        self._link_and_insert_event(effect_text, embedding)
+
+    def add_events(self, effect_texts: List[str]) -> List[int]:
+        """Add several events with one batched embedding call and one transaction.
+
+        Events are linked in order, so an event can be caused by an earlier
+        one from the same batch. Returns the new event ids.
+        """
+        texts = list(effect_texts)
+        for effect_text in texts:
+            if not effect_text or not effect_text.strip():
+                raise ValueError("effect_text cannot be empty")
+        if not texts:
+            return []
+        embeddings = self._get_cached_embeddings(texts)
+
+        event_ids: List[int] = []
+        self.conn.execute("BEGIN TRANSACTION")
+        try:
+            for effect_text, embedding in zip(texts, embeddings):
+                event_ids.append(self._link_and_insert_event(effect_text, embedding))
+            self.conn.execute("COMMIT")
+        except Exception:
+            self.conn.execute("ROLLBACK")
+            raise
+        return event_ids
+
+    def _link_and_insert_event(self, effect_text: str, embedding: List[float]) -> int:
         potential_causes = self._find_potential_causes(embedding, effect_text)
 
         cause_id: Optional[int] = None
@@ -230,9 +301,10 @@ class CausalMemoryCore:
                 logger.info("Soft link enforced (score %.3f) for event %s", score, cause.event_id)
                 break
 
-        self._insert_event(effect_text, embedding, cause_id, relationship_text)
+        event_id = self._insert_event(effect_text, embedding, cause_id, relationship_text)
         if cause_id is not None:
             self._apply_causal_boost(cause_id)
+        return event_id
 
     def query(self, query_text: str) -> str:
         if not query_text or not query_text.strip():
@@ -280,15 +352,12 @@ class CausalMemoryCore:
         if not rows:
             return []
         candidates: List[tuple[Event, float]] = []
-        eff_np = np.array(embedding, dtype=float)
-        for row in rows:
-            emb = np.array(row[3], dtype=float)
+        for row, sim in zip(rows, _cosine_similarities(rows, embedding)):
             if row[2] == effect_text:
                 continue
-            denom = np.linalg.norm(eff_np) * np.linalg.norm(emb)
-            if denom == 0:
+            if np.isnan(sim):
                 continue
-            sim = float(np.dot(eff_np, emb) / denom)
+            sim = float(sim)
             if sim >= self.similarity_threshold:
                 candidates.append((Event(*row), sim))
         candidates.sort(key=lambda pair: (pair[1], pair[0].timestamp), reverse=True)
@@ -453,15 +522,14 @@ class CausalMemoryCore:
             "SELECT event_id, timestamp, effect_text, embedding, cause_id, relationship_text, vitality "
             "FROM events"
         ).fetchall()
+        if not rows:
+            return None
         best_score = -1.0
         best_event: Optional[Event] = None
-        query_vec = np.array(embedding, dtype=float)
-        for row in rows:
-            emb = np.array(row[3], dtype=float)
-            denom = np.linalg.norm(query_vec) * np.linalg.norm(emb)
-            if denom == 0:
+        for row, sim in zip(rows, _cosine_similarities(rows, embedding)):
+            if np.isnan(sim):
                 continue
-            sim = float(np.dot(query_vec, emb) / denom)
+            sim = float(sim)
             vitality = row[6] if row[6] is not None else 1.0
             final_score = sim * (0.7 + 0.3 * vitality)
             row_ts = row[1].replace(tzinfo=None) if row[1].tzinfo else row[1]
@@ -558,6 +626,17 @@ class CausalMemoryCore:
         chain_id = chain_wire.get("_chain_id", "unknown")
         return {"event_id": None, "extracted_text": event_text, "chain_id": chain_id}
 
+    def reset(self) -> None:
+        """Delete all live and archived events and restart event ids at 1.
+
+        The connection, LLM client and embedding model stay loaded, so a
+        reset core can be reused for another run without re-initialising.
+        Cached embeddings are kept since they depend only on text and model.
+        """
+        self.conn.execute("DELETE FROM events")
+        self.conn.execute("DELETE FROM events_archive")
+        self.conn.execute("UPDATE _events_seq SET val = 1")
+
     def close(self) -> None:
         try:
             self.conn.close()
@@ -16,7 +16,7 @@ import mcp.types as types
 from mcp.server import NotificationOptions, Server
 from mcp.server.stdio import stdio_server
 
-from config import Config
+from config import Config, load_env
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
@@ -25,7 +25,8 @@ logger = logging.getLogger("causal-memory-railway-client")
 # Create server instance (MCP server that proxies to Railway)
 server = Server("causal-memory-railway-client")
 
-# Railway endpoint configuration
+# Railway endpoint configuration (read from .env as well as the environment)
+load_env()
 RAILWAY_BASE_URL = os.getenv(
     "RAILWAY_BASE_URL", 
     "https://causal-memory-core-production.up.railway.app"
@@ -6,6 +6,7 @@ Supports dual transports: stdio for local usage and Starlette/uvicorn SSE for cl
 """
 
 import asyncio
+import json
 import logging
 import os
 from typing import Optional
@@ -206,7 +207,6 @@ async def handle_call_tool(name: str, arguments: Optional[dict]) -> list[types.T
             )]
 
         elif name == "query_as_ref":
-            import json as _json
             query = arguments.get("query")
             if not query:
                 return [types.TextContent(
@@ -218,11 +218,10 @@ async def handle_call_tool(name: str, arguments: Optional[dict]) -> list[types.T
             logger.info(f"query_as_ref: {result}")
             return [types.TextContent(
                 type="text",
-                text=_json.dumps(result, default=str)
+                text=json.dumps(result, default=str)
             )]
 
         elif name == "add_event_chain":
-            import json as _json
             chain_wire = arguments.get("chain")
             if chain_wire is None:
                 return [types.TextContent(
@@ -233,7 +232,7 @@ async def handle_call_tool(name: str, arguments: Optional[dict]) -> list[types.T
             logger.info(f"add_event_chain: {result}")
             return [types.TextContent(
                 type="text",
-                text=_json.dumps(result, default=str)
+                text=json.dumps(result, default=str)
             )]
 
         else:
@@ -26,8 +26,11 @@ ROOT = pathlib.Path(__file__).resolve().parent
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
+from config import load_env
 from src.causal_memory_core import CausalMemoryCore
 
+load_env()
+
 
 @dataclass
 class StressTestConfig:
@@ -21,6 +21,8 @@ sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
 
 from causal_memory_core import CausalMemoryCore
 
+_PROCESS = psutil.Process()
+
 
 class PerformanceBenchmarks:
     """Performance benchmarking utilities"""
@@ -30,7 +32,8 @@ class PerformanceBenchmarks:
         """Context manager to collect performance metrics during test execution"""
         # Start metrics collection
         start_time = time.time()
-        start_memory = psutil.Process().memory_info().rss / 1024 / 1024  # MB
+        start_clock = time.perf_counter()
+        start_memory = _PROCESS.memory_info().rss / 1024 / 1024  # MB
         start_cpu_percent = psutil.cpu_percent()
         
         # Force garbage collection for clean measurement
@@ -49,12 +52,13 @@ class PerformanceBenchmarks:
         finally:
             # End metrics collection
             end_time = time.time()
-            end_memory = psutil.Process().memory_info().rss / 1024 / 1024  # MB
+            execution_time = time.perf_counter() - start_clock
+            end_memory = _PROCESS.memory_info().rss / 1024 / 1024  # MB
             end_cpu_percent = psutil.cpu_percent()
             
             metrics.update({
                 'end_time': end_time,
-                'execution_time_seconds': end_time - start_time,
+                'execution_time_seconds': execution_time,
                 'end_memory_mb': end_memory,
                 'memory_delta_mb': end_memory - start_memory,
                 'end_cpu_percent': end_cpu_percent,
@@ -138,19 +142,19 @@ class TestPerformanceBenchmarks:
             operations = []
             
             # Test adding single event
-            start_op = time.time()
+            start_op = time.perf_counter()
             memory_core.add_event("User clicked the save button")
             operations.append({
                 'operation': 'add_event',
-                'duration': time.time() - start_op
+                'duration': time.perf_counter() - start_op
             })
             
             # Test querying
-            start_op = time.time()
+            start_op = time.perf_counter()
             context = memory_core.get_context("save button click")
             operations.append({
                 'operation': 'get_context', 
-                'duration': time.time() - start_op,
+                'duration': time.perf_counter() - start_op,
                 'context_length': len(context)
             })
             
@@ -180,22 +184,22 @@ class TestPerformanceBenchmarks:
                 events = [f"User performed action {i} in the workflow" for i in range(count)]
                 
                 add_times = []
-                start_bulk = time.time()
+                start_bulk = time.perf_counter()
                 
                 for i, event in enumerate(events):
-                    start_single = time.time()
+                    start_single = time.perf_counter()
                     memory_core.add_event(event)
-                    add_times.append(time.time() - start_single)
+                    add_times.append(time.perf_counter() - start_single)
                     
                     if i % 10 == 0:  # Small delay every 10 events for realistic timing
                         time.sleep(0.001)
                 
-                bulk_duration = time.time() - start_bulk
+                bulk_duration = time.perf_counter() - start_bulk
                 
                 # Test query performance with many events
-                query_start = time.time()
+                query_start = time.perf_counter()
                 context = memory_core.get_context("workflow actions")
-                query_duration = time.time() - query_start
+                query_duration = time.perf_counter() - query_start
                 
                 memory_core.close()
                 
@@ -236,7 +240,7 @@ class TestPerformanceBenchmarks:
                 
                 # Sample memory usage
                 gc.collect()  # Force garbage collection for accurate measurement
-                memory_usage = psutil.Process().memory_info().rss / 1024 / 1024  # MB
+                memory_usage = _PROCESS.memory_info().rss / 1024 / 1024  # MB
                 
                 memory_samples.append({
                     'event_count': count,
@@ -291,9 +295,9 @@ class TestPerformanceBenchmarks:
             query_results = []
             
             for query in queries:
-                start_time = time.time()
+                start_time = time.perf_counter()
                 context = memory_core.get_context(query)
-                duration = time.time() - start_time
+                duration = time.perf_counter() - start_time
                 
                 query_results.append({
                     'query': query,
@@ -313,32 +317,32 @@ class TestPerformanceBenchmarks:
         """Benchmark database operation performance"""
         with benchmarker.benchmark_context('database_operations') as metrics:
             # Test initialization time
-            init_start = time.time()
+            init_start = time.perf_counter()
             memory_core = CausalMemoryCore(
                 db_path=temp_db_path,
                 llm_client=mock_openai_client,
                 embedding_model=mock_embedder
             )
-            init_time = time.time() - init_start
+            init_time = time.perf_counter() - init_start
             
             # Test database writing performance
             write_times = []
             for i in range(20):
-                start_write = time.time()
+                start_write = time.perf_counter()
                 memory_core.add_event(f"Database performance test event {i}")
-                write_times.append(time.time() - start_write)
+                write_times.append(time.perf_counter() - start_write)
             
             # Test database reading performance
             read_times = []
             for i in range(10):
-                start_read = time.time()
+                start_read = time.perf_counter()
                 context = memory_core.get_context(f"performance test {i}")
-                read_times.append(time.time() - start_read)
+                read_times.append(time.perf_counter() - start_read)
             
             # Test close operation
-            close_start = time.time()
+            close_start = time.perf_counter()
             memory_core.close()
-            close_time = time.time() - close_start
+            close_time = time.perf_counter() - close_start
             
             metrics['initialization_time'] = init_time
             metrics['average_write_time'] = mean(write_times)
@@ -359,21 +363,21 @@ class TestPerformanceBenchmarks:
             
             # Simulate concurrent-like operations by rapidly adding events and querying
             operations = []
-            start_concurrent = time.time()
+            start_concurrent = time.perf_counter()
             
             for i in range(50):
                 # Add event
-                add_start = time.time()
+                add_start = time.perf_counter()
                 memory_core.add_event(f"Concurrent test event {i}")
-                add_time = time.time() - add_start
+                add_time = time.perf_counter() - add_start
                 
                 operations.append({'type': 'add', 'duration': add_time, 'index': i})
                 
                 # Every 5th operation, also do a query
                 if i % 5 == 0:
-                    query_start = time.time()
+                    query_start = time.perf_counter()
                     context = memory_core.get_context(f"concurrent test {i}")
-                    query_time = time.time() - query_start
+                    query_time = time.perf_counter() - query_start
                     
                     operations.append({
                         'type': 'query', 
@@ -382,7 +386,7 @@ class TestPerformanceBenchmarks:
                         'context_found': context != "No relevant context found in memory."
                     })
             
-            total_concurrent_time = time.time() - start_concurrent
+            total_concurrent_time = time.perf_counter() - start_concurrent
             memory_core.close()
             
             # Analyze operations
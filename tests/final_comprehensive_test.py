@@ -4,14 +4,43 @@ Final Comprehensive Test Suite for Causal Memory Core
 Runs all tests, benchmarks, and generates complete development statistics
 """
 
+import contextlib
+import importlib.util
+import io
 import os
 import sys
 import subprocess
+import threading
 import time
 import json
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone
 from pathlib import Path
 
+# Report wording for a step's success flag
+PASS_FAIL = {True: '✅ PASSED', False: '❌ FAILED'}
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+SRC_DIR = REPO_ROOT / "src"
+SCRIPTS_DIR = REPO_ROOT / "scripts"
+
+
+def _load_script_module(name):
+    """Load scripts/<name>.py without touching sys.path
+
+    This file matches pytest's *_test.py pattern, so importing it must not
+    change the path every other collected test module sees.
+    """
+    spec = importlib.util.spec_from_file_location(name, SCRIPTS_DIR / f"{name}.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+dumps = _load_script_module("_jsonio").dumps
+
+
 class FinalTestSuite:
     """Complete test suite runner with comprehensive reporting"""
     
@@ -19,64 +48,101 @@ class FinalTestSuite:
         self.project_root = Path(__file__).parent
         self.results_dir = self.project_root / "test_results"
         self.start_time = datetime.now(timezone.utc)
+        # Monotonic reference for durations; start_time is for display only
+        self.start_clock = time.perf_counter()
+        # On CI, phase progress is emitted as JSON lines instead of banners
+        self.json_progress = bool(os.getenv('CI'))
+        
+    # Output lines kept per command for the results file; older lines are
+    # dropped so long verbose runs do not pile up in memory
+    OUTPUT_TAIL_LINES = 500
+    
+    def run_command(self, cmd, description="Running command", timeout=600, log=print, echo=None):
+        """Run command with timing and error handling
+
+        Progress lines go through ``log`` so concurrent callers can buffer
+        them instead of interleaving on the console. The command's output
+        (stderr merged into stdout) is streamed line by line to ``echo``
+        when given, and only its last OUTPUT_TAIL_LINES lines are kept.
+        """
+        log(f"🔧 {description}")
+        log(f"   Command: {' '.join(cmd)}")
+        
+        start_time = time.perf_counter()
+        tail = deque(maxlen=self.OUTPUT_TAIL_LINES)
+        timed_out = threading.Event()
+        
+        def kill(proc):
+            timed_out.set()
+            proc.kill()
         
-    def run_command(self, cmd, description="Running command", timeout=600):
-        """Run command with timing and error handling"""
-        print(f"🔧 {description}")
-        print(f"   Command: {' '.join(cmd)}")
-        
-        start_time = time.time()
         try:
-            result = subprocess.run(
+            with subprocess.Popen(
                 cmd,
                 cwd=self.project_root,
-                capture_output=True,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
                 text=True,
-                timeout=timeout
-            )
-            duration = time.time() - start_time
+                bufsize=1
+            ) as proc:
+                timer = threading.Timer(timeout, kill, args=(proc,))
+                timer.start()
+                try:
+                    for line in proc.stdout:
+                        tail.append(line)
+                        if echo is not None:
+                            echo(line)
+                    returncode = proc.wait()
+                finally:
+                    timer.cancel()
+            duration = time.perf_counter() - start_time
+            output = ''.join(tail)
+            
+            if timed_out.is_set():
+                log(f"   ⏰ TIMEOUT after {timeout}s")
+                return {
+                    'success': False,
+                    'duration': timeout,
+                    'stdout': output,
+                    'stderr': 'Command timed out',
+                    'returncode': -1
+                }
             
-            success = result.returncode == 0
+            success = returncode == 0
             status = "✅ SUCCESS" if success else "❌ FAILED"
             
-            print(f"   {status} ({duration:.2f}s)")
+            log(f"   {status} ({duration:.2f}s)")
             
             if not success:
-                print(f"   Error: {result.stderr[:200]}...")
+                log(f"   Error: {output[-200:]}...")
                 
             return {
                 'success': success,
                 'duration': duration,
-                'stdout': result.stdout,
-                'stderr': result.stderr,
-                'returncode': result.returncode
+                'stdout': output,
+                'stderr': '',
+                'returncode': returncode
             }
             
-        except subprocess.TimeoutExpired:
-            print(f"   ⏰ TIMEOUT after {timeout}s")
-            return {
-                'success': False,
-                'duration': timeout,
-                'stdout': '',
-                'stderr': 'Command timed out',
-                'returncode': -1
-            }
         except Exception as e:
-            duration = time.time() - start_time
-            print(f"   💥 ERROR: {e}")
+            duration = time.perf_counter() - start_time
+            log(f"   💥 ERROR: {e}")
             return {
                 'success': False,
                 'duration': duration,
-                'stdout': '',
+                'stdout': ''.join(tail),
                 'stderr': str(e),
                 'returncode': -2
             }
     
     def run_unit_tests(self):
         """Run unit tests"""
+        # No .pytest_cache writes: nothing here uses --lf/--ff, and the
+        # E2E files run as concurrent pytest processes
         return self.run_command(
-            [sys.executable, '-m', 'pytest', 'tests/test_memory_core.py', '-v', '--tb=short'],
-            "Running Unit Tests"
+            [sys.executable, '-m', 'pytest', '-p', 'no:cacheprovider', 'tests/test_memory_core.py', '-v', '--tb=short'],
+            "Running Unit Tests",
+            echo=sys.stdout.write
         )
     
     def run_e2e_tests(self):
@@ -88,45 +154,117 @@ class FinalTestSuite:
             'tests/e2e/test_realistic_scenarios_e2e.py'
         ]
         
+        # One directory listing instead of a stat() per test file
+        e2e_dir = os.path.dirname(test_files[0])
+        try:
+            existing = {entry.name for entry in os.scandir(e2e_dir) if entry.is_file()}
+        except OSError:
+            existing = set()
+        
         results = {}
+        present = []
         for test_file in test_files:
             test_name = Path(test_file).stem
-            if os.path.exists(test_file):
-                results[test_name] = self.run_command(
-                    [sys.executable, '-m', 'pytest', test_file, '-v', '--tb=short'],
-                    f"Running {test_name}"
-                )
+            if os.path.basename(test_file) in existing:
+                present.append((test_name, test_file))
             else:
                 print(f"⚠️  Skipping {test_file} (not found)")
                 results[test_name] = {'success': False, 'duration': 0, 'stderr': 'File not found'}
         
-        return results
+        def run_file(test_name, test_file):
+            lines = []
+            result = self.run_command(
+                [sys.executable, '-m', 'pytest', '-p', 'no:cacheprovider', test_file, '-v', '--tb=short'],
+                f"Running {test_name}",
+                log=lines.append
+            )
+            return test_name, result, lines
+        
+        # Each file is an independent pytest process, so run them side by
+        # side and print each one's progress as a block when it finishes
+        if present:
+            with ThreadPoolExecutor(max_workers=len(present)) as executor:
+                futures = [executor.submit(run_file, name, path) for name, path in present]
+                for future in as_completed(futures):
+                    test_name, result, lines = future.result()
+                    print('\n'.join(lines))
+                    results[test_name] = result
+        
+        # Keep the report in the declared file order
+        return {Path(f).stem: results[Path(f).stem] for f in test_files}
     
     def run_performance_benchmarks(self):
         """Run performance benchmark suite"""
         return self.run_command(
-            [sys.executable, '-m', 'pytest', 'tests/e2e/test_performance_benchmarks.py', '-v', '--tb=short'],
-            "Running Performance Benchmarks"
+            [sys.executable, '-m', 'pytest', '-p', 'no:cacheprovider', 'tests/e2e/test_performance_benchmarks.py', '-v', '--tb=short'],
+            "Running Performance Benchmarks",
+            echo=sys.stdout.write
         )
     
+    def run_in_process(self, func, description="Running step"):
+        """Run func() in this interpreter, returning the same result shape as
+        run_command. Saves a fresh interpreter start and re-import of the
+        heavy dependencies for steps that are plain Python entry points.
+        """
+        print(f"🔧 {description} (in process)")
+        
+        for path in (SRC_DIR, SCRIPTS_DIR):
+            if str(path) not in sys.path:
+                sys.path.insert(0, str(path))
+        
+        output = io.StringIO()
+        previous_cwd = os.getcwd()
+        start_time = time.perf_counter()
+        try:
+            os.chdir(self.project_root)
+            with contextlib.redirect_stdout(output):
+                success = bool(func())
+            duration = time.perf_counter() - start_time
+            status = "✅ SUCCESS" if success else "❌ FAILED"
+            print(f"   {status} ({duration:.2f}s)")
+            return {
+                'success': success,
+                'duration': duration,
+                'stdout': output.getvalue(),
+                'stderr': '',
+                'returncode': 0 if success else 1
+            }
+        except Exception as e:
+            duration = time.perf_counter() - start_time
+            print(f"   💥 ERROR: {e}")
+            return {
+                'success': False,
+                'duration': duration,
+                'stdout': output.getvalue(),
+                'stderr': str(e),
+                'returncode': -2
+            }
+        finally:
+            os.chdir(previous_cwd)
+    
     def run_quick_benchmark(self):
         """Run quick benchmark for baseline metrics"""
-        return self.run_command(
-            [sys.executable, 'quick_benchmark.py'],
-            "Running Quick Benchmark"
-        )
+        def quick_benchmark_main():
+            import quick_benchmark
+            success = quick_benchmark.run_quick_benchmark()
+            if success:
+                quick_benchmark.update_journal()
+            return success
+        
+        return self.run_in_process(quick_benchmark_main, "Running Quick Benchmark")
     
     def analyze_results(self):
         """Analyze all benchmark results"""
-        return self.run_command(
-            [sys.executable, 'analyze_benchmarks.py'],
-            "Analyzing Benchmark Results"
-        )
+        def analyze_benchmarks_main():
+            import analyze_benchmarks
+            return analyze_benchmarks.main()
+        
+        return self.run_in_process(analyze_benchmarks_main, "Analyzing Benchmark Results")
     
     def generate_final_report(self, results):
         """Generate comprehensive final report"""
         end_time = datetime.now(timezone.utc)
-        total_duration = (end_time - self.start_time).total_seconds()
+        total_duration = time.perf_counter() - self.start_clock
         
         # Count successes and failures
         unit_success = results['unit_tests']['success']
@@ -147,7 +285,7 @@ class FinalTestSuite:
         
         success_rate = (total_successes / total_tests) * 100
         
-        report = f"""# Causal Memory Core - Final Test Report
+        parts = [f"""# Causal Memory Core - Final Test Report
 
 ## Test Execution Summary
 
@@ -158,22 +296,22 @@ class FinalTestSuite:
 ## Test Results
 
 ### Unit Tests
-- **Status**: {'✅ PASSED' if unit_success else '❌ FAILED'}
+- **Status**: {PASS_FAIL[unit_success]}
 - **Duration**: {results['unit_tests']['duration']:.2f}s
 
 ### End-to-End Tests
 - **Overall**: {e2e_successes}/{e2e_total} passed
-"""
+"""]
         
         for test_name, test_result in results['e2e_tests'].items():
-            status = '✅ PASSED' if test_result['success'] else '❌ FAILED'
-            report += f"- **{test_name}**: {status} ({test_result['duration']:.2f}s)\n"
+            status = PASS_FAIL[test_result['success']]
+            parts.append(f"- **{test_name}**: {status} ({test_result['duration']:.2f}s)\n")
         
-        report += f"""
+        parts.append(f"""
 ### Performance Tests
-- **Benchmarks**: {'✅ PASSED' if benchmark_success else '❌ FAILED'} ({results['benchmarks']['duration']:.2f}s)
-- **Quick Benchmark**: {'✅ PASSED' if quick_success else '❌ FAILED'} ({results['quick_benchmark']['duration']:.2f}s)
-- **Analysis**: {'✅ PASSED' if analysis_success else '❌ FAILED'} ({results['analysis']['duration']:.2f}s)
+- **Benchmarks**: {PASS_FAIL[benchmark_success]} ({results['benchmarks']['duration']:.2f}s)
+- **Quick Benchmark**: {PASS_FAIL[quick_success]} ({results['quick_benchmark']['duration']:.2f}s)
+- **Analysis**: {PASS_FAIL[analysis_success]} ({results['analysis']['duration']:.2f}s)
 
 ## Performance Metrics Summary
 
@@ -186,32 +324,32 @@ Based on benchmark results:
 
 ## System Health Assessment
 
-"""
+""")
         
         if success_rate >= 90:
-            report += """✅ **EXCELLENT**: System is performing very well
+            parts.append("""✅ **EXCELLENT**: System is performing very well
 - All critical functionality working
 - Performance within expected ranges
 - Ready for production use
-"""
+""")
         elif success_rate >= 80:
-            report += """⚠️ **GOOD**: System is mostly functional with minor issues  
+            parts.append("""⚠️ **GOOD**: System is mostly functional with minor issues  
 - Core functionality working
 - Some edge cases may need attention
 - Performance is acceptable
-"""
+""")
         elif success_rate >= 60:
-            report += """⚠️ **MODERATE**: System has several issues
+            parts.append("""⚠️ **MODERATE**: System has several issues
 - Basic functionality working
 - Multiple test failures need investigation
 - Performance may be degraded
-"""
+""")
         else:
-            report += """❌ **POOR**: System has significant problems
+            parts.append("""❌ **POOR**: System has significant problems
 - Many test failures indicate serious issues
 - Functionality and performance compromised
 - Requires immediate attention
-"""
+""")
         
         # Add detailed failure analysis if needed
         failures = []
@@ -226,46 +364,78 @@ Based on benchmark results:
             failures.append("Performance benchmarks")
         
         if failures:
-            report += f"""
+            parts.append(f"""
 ## Issues Requiring Attention
 
 {chr(10).join(f'- {failure}' for failure in failures)}
-"""
+""")
         
-        report += f"""
+        parts.append(f"""
 ## Recommendations
 
-"""
+""")
         
         if success_rate >= 95:
-            report += """- ✅ System is ready for production
+            parts.append("""- ✅ System is ready for production
 - ✅ Consider setting up automated regression testing
 - ✅ Monitor performance metrics in production
-"""
+""")
         else:
-            report += """- 🔧 Address failing tests before production deployment
+            parts.append("""- 🔧 Address failing tests before production deployment
 - 📊 Investigate performance bottlenecks
 - 🧪 Run tests regularly during development
-"""
+""")
+        
+        report = ''.join(parts)
         
         # Save report
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = end_time.astimezone().strftime("%Y%m%d_%H%M%S")
         report_file = self.results_dir / "reports" / f"final_test_report_{timestamp}.md"
         report_file.parent.mkdir(exist_ok=True)
         
-        with open(report_file, 'w', encoding='utf-8') as f:
-            f.write(report)
+        report_file.write_text(report, encoding='utf-8')
         
-        # Also save raw results data
+        # Also save raw results data; command output goes to per-step .log
+        # files so the JSON only carries the small fields and log paths
         results_file = self.results_dir / "reports" / f"final_test_results_{timestamp}.json"
-        with open(results_file, 'w') as f:
-            json.dump(results, f, indent=2, default=str)
+        log_dir = self.results_dir / "reports" / f"final_test_logs_{timestamp}"
+        results_file.write_bytes(dumps(self.split_output_logs(results, log_dir), default=str))
         
         print(f"\n📄 Final report saved: {report_file}")
         print(f"📊 Raw results saved: {results_file}")
         
         return report, success_rate
     
+    OUTPUT_KEYS = ('stdout', 'stderr')
+    
+    def split_output_logs(self, results, log_dir, prefix=''):
+        """Return a copy of results with command output moved to .log files
+
+        Each step dict holding stdout/stderr has them written to
+        ``log_dir/<step>.log`` and replaced by a ``log_file`` path. Nested
+        step groups (the E2E files) are handled recursively.
+        """
+        compact = {}
+        for key, value in results.items():
+            if not isinstance(value, dict):
+                compact[key] = value
+                continue
+            name = f"{prefix}{key}"
+            if not any(k in value for k in self.OUTPUT_KEYS):
+                compact[key] = self.split_output_logs(value, log_dir, f"{name}.")
+                continue
+            step = {k: v for k, v in value.items() if k not in self.OUTPUT_KEYS}
+            output = ''.join(
+                f"===== {k} =====\n{value[k]}\n" for k in self.OUTPUT_KEYS if value.get(k)
+            )
+            if output:
+                log_dir.mkdir(parents=True, exist_ok=True)
+                log_file = log_dir / f"{name}.log"
+                log_file.write_text(output, encoding='utf-8')
+                step['log_file'] = str(log_file)
+            compact[key] = step
+        return compact
+    
     def update_journal(self, success_rate, total_duration):
         """Update development journal with final results"""
         journal_file = self.results_dir / "benchmarking_journal.md"
@@ -317,12 +487,42 @@ Based on benchmark results:
         
         print(f"📓 Updated development journal: {journal_file}")
     
+    def phases(self):
+        """(results key, label, runner) for each phase, in run order"""
+        return (
+            ('unit_tests', 'PHASE 1: Unit Tests', self.run_unit_tests),
+            ('e2e_tests', 'PHASE 2: End-to-End Tests', self.run_e2e_tests),
+            ('benchmarks', 'PHASE 3: Performance Benchmarks', self.run_performance_benchmarks),
+            ('quick_benchmark', 'PHASE 4: Quick Benchmark', self.run_quick_benchmark),
+            ('analysis', 'PHASE 5: Results Analysis', self.analyze_results),
+        )
+    
+    def report_phase(self, key, label, status, result=None):
+        """Write one progress record at a phase boundary and flush once
+
+        Emits a JSON line (phase, status, ts and, when done, success) on CI
+        and the decorative banner otherwise.
+        """
+        if self.json_progress:
+            record = {'phase': key, 'status': status, 'ts': time.time()}
+            if result is not None:
+                record['success'] = result.get('success')
+            sys.stdout.write(json.dumps(record) + "\n")
+        elif status == 'start':
+            sys.stdout.write(f"📋 {label}\n")
+        else:
+            sys.stdout.write("\n")
+        sys.stdout.flush()
+    
     def run_complete_suite(self):
         """Run the complete test suite"""
-        print("🚀 CAUSAL MEMORY CORE - FINAL COMPREHENSIVE TEST SUITE")
-        print("=" * 80)
-        print(f"Started: {self.start_time.strftime('%Y-%m-%d %H:%M UTC')}")
-        print()
+        if not self.json_progress:
+            sys.stdout.write(
+                "🚀 CAUSAL MEMORY CORE - FINAL COMPREHENSIVE TEST SUITE\n"
+                + "=" * 80 + "\n"
+                + f"Started: {self.start_time.strftime('%Y-%m-%d %H:%M UTC')}\n\n"
+            )
+            sys.stdout.flush()
         
         results = {
             'start_time': self.start_time.isoformat(),
@@ -334,29 +534,14 @@ Based on benchmark results:
         }
         
         # Run all test categories
-        print("📋 PHASE 1: Unit Tests")
-        results['unit_tests'] = self.run_unit_tests()
-        print()
-        
-        print("📋 PHASE 2: End-to-End Tests")
-        results['e2e_tests'] = self.run_e2e_tests()
-        print()
-        
-        print("📋 PHASE 3: Performance Benchmarks")
-        results['benchmarks'] = self.run_performance_benchmarks()
-        print()
-        
-        print("📋 PHASE 4: Quick Benchmark")
-        results['quick_benchmark'] = self.run_quick_benchmark()
-        print()
-        
-        print("📋 PHASE 5: Results Analysis")
-        results['analysis'] = self.analyze_results()
-        print()
+        for key, label, run in self.phases():
+            self.report_phase(key, label, 'start')
+            results[key] = run()
+            self.report_phase(key, label, 'done', results[key])
         
         # Generate final report
         end_time = datetime.now(timezone.utc)
-        total_duration = (end_time - self.start_time).total_seconds()
+        total_duration = time.perf_counter() - self.start_clock
         results['end_time'] = end_time.isoformat()
         results['total_duration'] = total_duration
         
@@ -0,0 +1,153 @@
+"""
+Unit tests for the benchmark aggregation in scripts/analyze_benchmarks.py
+"""
+
+import contextlib
+import io
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from unittest.mock import patch
+
+SCRIPTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'scripts')
+
+analyze_benchmarks = None
+
+
+def setUpModule():
+    # analyze_benchmarks imports _jsonio by bare name, and pool workers must
+    # be able to import analyze_benchmarks, so scripts/ stays on sys.path
+    # only while this module's tests run
+    global analyze_benchmarks
+    sys.path.insert(0, SCRIPTS_DIR)
+    import analyze_benchmarks
+
+
+def tearDownModule():
+    sys.path.remove(SCRIPTS_DIR)
+
+
+def make_records(count, offset=0):
+    return [
+        {
+            'test_name': ('add_event', 'query', 'bulk')[i % 3],
+            'execution_time_seconds': 0.01 * ((i * 7 + offset) % 13 + 1),
+            'memory_delta_mb': 0.5 * ((i * 5 + offset) % 11),
+            'timestamp': f'2026-10-{i % 28 + 1:02d}T10:00:00+00:00'
+        }
+        for i in range(count)
+    ]
+
+
+class TestBenchmarkAggregate(unittest.TestCase):
+    """Test that per-file aggregates merge to the single-pass result"""
+
+    def assert_stats_equal(self, merged, single):
+        self.assertEqual(merged.n, single.n)
+        self.assertAlmostEqual(merged.mean, single.mean)
+        self.assertAlmostEqual(merged.m2, single.m2)
+        self.assertEqual(merged.summary()['median'], single.summary()['median'])
+        self.assertEqual((merged.min, merged.max), (single.min, single.max))
+
+    def test_merged_stats_equal_single_pass(self):
+        """Merging chunk aggregates matches folding every record into one"""
+        records = make_records(50)
+        single = analyze_benchmarks.BenchmarkAggregate()
+        for r in records:
+            single.add(r)
+
+        merged = analyze_benchmarks.BenchmarkAggregate()
+        for start, stop in ((0, 7), (7, 8), (8, 8), (8, 31), (31, 50)):
+            chunk = analyze_benchmarks.BenchmarkAggregate()
+            for r in records[start:stop]:
+                chunk.add(r)
+            merged.merge(chunk)
+
+        self.assertEqual(merged.total, single.total)
+        self.assertEqual((merged.earliest, merged.latest), (single.earliest, single.latest))
+        self.assertEqual(merged.by_test.keys(), single.by_test.keys())
+        for test_name, (count, execution_times, memory_deltas) in single.by_test.items():
+            merged_count, merged_times, merged_memory = merged.by_test[test_name]
+            self.assertEqual(merged_count, count)
+            self.assert_stats_equal(merged_times, execution_times)
+            self.assert_stats_equal(merged_memory, memory_deltas)
+
+
+class TestBenchmarkAnalyzer(unittest.TestCase):
+    """Test the per-file analysis cache and the process-pool path"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        for i in range(5):
+            self.write_json(f'bench_{i}.json', make_records(1, offset=i)[0])
+        with open(os.path.join(self.temp_dir, 'daily_benchmarks_20261016.jsonl'), 'w') as f:
+            for r in make_records(20):
+                f.write(json.dumps(r) + '\n')
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def write_json(self, name, data):
+        with open(os.path.join(self.temp_dir, name), 'w') as f:
+            json.dump(data, f)
+
+    def load(self, analyzer):
+        """Run load_benchmark_aggregate, returning it and the files it parsed"""
+        parsed = []
+        original = analyze_benchmarks.BenchmarkAnalyzer._aggregate_files
+
+        # A plain function patched on the class, not a Mock on the instance:
+        # the pool pickles the bound loaders, and with them the instance
+        def record_stale(self, stale):
+            parsed.extend(os.path.basename(path) for path, _ in stale)
+            return original(self, stale)
+
+        with patch.object(analyze_benchmarks.BenchmarkAnalyzer, '_aggregate_files', record_stale), \
+                contextlib.redirect_stdout(io.StringIO()):
+            aggregate = analyzer.load_benchmark_aggregate()
+        return aggregate, sorted(parsed)
+
+    def test_cache_reused_until_file_changes(self):
+        """Unchanged files come from the cache; a changed file is re-parsed"""
+        analyzer = analyze_benchmarks.BenchmarkAnalyzer(self.temp_dir)
+        first, parsed = self.load(analyzer)
+        self.assertEqual(len(parsed), 6)
+        self.assertTrue(analyzer.cache_file.exists())
+
+        second, parsed = self.load(analyzer)
+        self.assertEqual(parsed, [])
+        self.assertEqual(second.total, first.total)
+
+        self.write_json('bench_2.json', dict(make_records(1)[0], test_name='changed_test'))
+        third, parsed = self.load(analyzer)
+        self.assertEqual(parsed, ['bench_2.json'])
+        self.assertEqual(third.total, first.total)
+        self.assertIn('changed_test', third.by_test)
+
+        os.remove(os.path.join(self.temp_dir, 'bench_2.json'))
+        fourth, parsed = self.load(analyzer)
+        self.assertEqual(parsed, [])
+        self.assertEqual(fourth.total, first.total - 1)
+        self.assertNotIn('changed_test', fourth.by_test)
+
+    def test_serial_and_process_pool_summaries_match(self):
+        """Parsing inline and in worker processes gives the same analysis"""
+        summaries = []
+        for parallel_min_files in (len(os.listdir(self.temp_dir)) + 1, 1):
+            analyzer = analyze_benchmarks.BenchmarkAnalyzer(self.temp_dir)
+            analyzer.PARALLEL_MIN_FILES = parallel_min_files
+            if analyzer.cache_file.exists():
+                os.remove(analyzer.cache_file)
+            aggregate, parsed = self.load(analyzer)
+            self.assertEqual(len(parsed), 6)
+            summaries.append(analyzer.analyze_performance_trends(aggregate))
+
+        serial, pooled = summaries
+        self.assertEqual(pooled, serial)
+
+
+if __name__ == '__main__':
+    unittest.main()
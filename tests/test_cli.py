@@ -288,11 +288,21 @@ class TestCLI(unittest.TestCase):
         args = parser.parse_args(['--db-path', 'custom.db'])
         self.assertEqual(args.db_path, 'custom.db')
 
+    def test_parse_args_fast_path_matches_argparse(self):
+        """Test the --add/--query fast path returns what argparse would"""
+        parser = cli.build_parser()
+        for argv in (['--add', 'test event'], ['-a', 'e'], ['--query', 'q'], ['-q', '']):
+            self.assertEqual(cli.parse_args(argv), parser.parse_args(argv))
+
+        # Values that look like options are left to argparse
+        self.assertIsNone(cli._fast_parse(['--add', '--query']))
+        self.assertIsNone(cli._fast_parse(['--add', 'x', '--db-path', 'db']))
+
     @patch.dict('os.environ', {}, clear=True)
-    @patch('cli.load_dotenv')  # Mock load_dotenv to prevent loading .env file
+    @patch('cli.load_env')  # Mock load_env to prevent loading .env file
     @patch('sys.exit')
     @patch('cli.CausalMemoryCore')
-    def test_main_missing_api_key(self, mock_memory_core_class, mock_exit, mock_load_dotenv):
+    def test_main_missing_api_key(self, mock_memory_core_class, mock_exit, mock_load_env):
         """Test main function behavior when API key is missing"""
         # Make sys.exit raise SystemExit for testing
         mock_exit.side_effect = SystemExit(1)
@@ -332,6 +342,19 @@ class TestCLI(unittest.TestCase):
         self.assertIn("❌ Error initializing memory core: Init error", output)
         mock_exit.assert_called_with(1)
 
+    @patch.dict('os.environ', {'OPENAI_API_KEY': 'test-key'})
+    @patch('cli.CausalMemoryCore')
+    def test_main_calls_injected_exit(self, mock_memory_core_class):
+        """Test main reports errors through an injected exit callable"""
+        mock_memory_core_class.side_effect = Exception("Init error")
+        exit_calls = []
+
+        with patch('sys.stdout', io.StringIO()):
+            code = cli.main(['--add', 'test event'], exit=exit_calls.append)
+
+        self.assertEqual(code, 1)
+        self.assertEqual(exit_calls, [1])
+
     @patch.dict('os.environ', {'OPENAI_API_KEY': 'test-key'})
     @patch('cli.CausalMemoryCore')
     def test_main_add_event_flow(self, mock_memory_core_class):
@@ -107,22 +107,38 @@ class TestConfig(unittest.TestCase):
             self.assertEqual(Config.SIMILARITY_THRESHOLD, 0.9)
 
     def test_invalid_numeric_values(self):
-        """Test invalid numeric values in env vars raise appropriate errors"""
+        """Test invalid numeric values in env vars raise on first access"""
         # Test invalid float conversion
         test_env = {'LLM_TEMPERATURE': 'invalid_float'}
         
         with patch.dict(os.environ, test_env, clear=True):
             import config
+            importlib.reload(config)
             with self.assertRaises(ValueError):
-                importlib.reload(config)
+                config.Config.LLM_TEMPERATURE
         
         # Test invalid int conversion
         test_env = {'MAX_POTENTIAL_CAUSES': 'invalid_int'}
         
         with patch.dict(os.environ, test_env, clear=True):
             import config
+            importlib.reload(config)
             with self.assertRaises(ValueError):
-                importlib.reload(config)
+                config.Config.MAX_POTENTIAL_CAUSES
+
+    def test_settings_are_read_lazily_and_cached(self):
+        """Test settings read the environment on first access, then keep that value"""
+        with patch.dict(os.environ, {}, clear=True):
+            import config
+            importlib.reload(config)
+            Config = config.Config
+            
+            os.environ['SIMILARITY_THRESHOLD'] = '0.7'
+            self.assertEqual(Config.SIMILARITY_THRESHOLD, 0.7)
+            self.assertEqual(Config().SIMILARITY_THRESHOLD, 0.7)
+            
+            os.environ['SIMILARITY_THRESHOLD'] = '0.9'
+            self.assertEqual(Config.SIMILARITY_THRESHOLD, 0.7)
 
     def test_boundary_values(self):
         """Test boundary values for numeric settings are handled correctly"""
@@ -203,6 +203,93 @@ class TestCausalMemoryCore(unittest.TestCase):
         self.assertIsNone(events[0][0])  # First event
         self.assertIsNone(events[1][0])  # Second event (no cause due to low similarity)
 
+    def test_add_events_batches_embeddings(self):
+        """add_events encodes the whole batch in one call and returns event ids"""
+        self.mock_embedder.encode.return_value = np.array([
+            [1.0, 0.0, 0.0, 0.0],
+            [0.0, 1.0, 0.0, 0.0],
+            [0.0, 0.0, 1.0, 0.0],
+        ])
+        
+        event_ids = self.memory_core.add_events(["First", "Second", "Third"])
+        
+        self.mock_embedder.encode.assert_called_once_with(["First", "Second", "Third"])
+        self.assertEqual(len(event_ids), 3)
+        rows = self.memory_core.conn.execute(
+            "SELECT event_id, effect_text FROM events ORDER BY event_id"
+        ).fetchall()
+        self.assertEqual(rows, list(zip(event_ids, ["First", "Second", "Third"])))
+        
+    def test_add_events_links_within_batch(self):
+        """Later events in a batch can be caused by earlier ones"""
+        mock_response = Mock()
+        mock_response.choices = [Mock()]
+        mock_response.choices[0].message.content = "The click caused the file to open"
+        self.mock_llm.chat.completions.create.return_value = mock_response
+        self.mock_embedder.encode.return_value = np.array([
+            [0.1, 0.2, 0.3, 0.4],
+            [0.11, 0.21, 0.31, 0.41],
+        ])
+        
+        first_id, second_id = self.memory_core.add_events(
+            ["The user clicked on a file", "The file opened"]
+        )
+        
+        cause_id = self.memory_core.conn.execute(
+            "SELECT cause_id FROM events WHERE event_id = ?", [second_id]
+        ).fetchone()[0]
+        self.assertEqual(cause_id, first_id)
+        
+    def test_add_events_rejects_empty_text_before_inserting(self):
+        """An empty text in the batch raises without storing any event"""
+        with self.assertRaises(ValueError):
+            self.memory_core.add_events(["Valid event", "   "])
+        
+        count = self.memory_core.conn.execute("SELECT COUNT(*) FROM events").fetchone()[0]
+        self.assertEqual(count, 0)
+
+    def test_add_events_rolls_back_batch_on_insert_failure(self):
+        """A failing insert undoes the whole batch, including the id sequence"""
+        self.mock_embedder.encode.return_value = np.array([
+            [1.0, 0.0, 0.0, 0.0],
+            [0.0, 1.0, 0.0, 0.0],
+        ])
+        original_insert = self.memory_core._insert_event
+        calls = []
+
+        def insert_then_fail(*args):
+            calls.append(args)
+            if len(calls) == 2:
+                raise RuntimeError("disk full")
+            return original_insert(*args)
+
+        with patch.object(self.memory_core, '_insert_event', side_effect=insert_then_fail):
+            with self.assertRaisesRegex(RuntimeError, "disk full"):
+                self.memory_core.add_events(["First", "Second"])
+
+        self.assertEqual(len(calls), 2)
+        count = self.memory_core.conn.execute("SELECT COUNT(*) FROM events").fetchone()[0]
+        self.assertEqual(count, 0)
+        seq = self.memory_core.conn.execute("SELECT val FROM _events_seq").fetchone()[0]
+        self.assertEqual(seq, 1)
+
+    def test_reset_clears_events_and_restarts_ids(self):
+        """reset() empties live and archived events and restarts ids at 1"""
+        self.memory_core.add_event("First event")
+        self.memory_core.add_event("Second event")
+        self.memory_core.conn.execute(
+            "INSERT INTO events_archive (event_id, timestamp, effect_text, embedding, "
+            "archived_at, archive_reason) VALUES (99, now(), 'old', [0.1], now(), 'test')"
+        )
+        
+        self.memory_core.reset()
+        
+        for table in ("events", "events_archive"):
+            count = self.memory_core.conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+            self.assertEqual(count, 0)
+        self.mock_embedder.encode.return_value = np.array([[0.1, 0.2, 0.3, 0.4]])
+        self.assertEqual(self.memory_core.add_events(["After reset"]), [1])
+
     # Additional tests for query() method
     def test_query_valid_single_event(self):
         """Query with single event returns that event."""
@@ -0,0 +1,144 @@
+"""
+Unit tests for the daily benchmark summary in scripts/run_comprehensive_tests.py
+"""
+
+import contextlib
+import io
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from datetime import datetime
+
+SCRIPTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'scripts')
+
+run_comprehensive_tests = None
+
+
+def setUpModule():
+    # The runner imports its sibling helpers (_deps, _jsonio) by bare name,
+    # so scripts/ goes on sys.path only while this module's tests run
+    global run_comprehensive_tests
+    sys.path.insert(0, SCRIPTS_DIR)
+    import run_comprehensive_tests
+
+
+def tearDownModule():
+    sys.path.remove(SCRIPTS_DIR)
+
+
+def record(test_name, seconds, memory_mb=1.0):
+    return {'test_name': test_name, 'execution_time_seconds': seconds,
+            'memory_delta_mb': memory_mb}
+
+
+class TestBenchmarkSummary(unittest.TestCase):
+    """Test the streaming, cached summary of the daily benchmark file"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.runner = run_comprehensive_tests.ComprehensiveTestRunner(self.temp_dir)
+        today = datetime.now().strftime('%Y%m%d')
+        self.daily_file = os.path.join(
+            self.temp_dir, 'test_results', 'benchmarks', f'daily_benchmarks_{today}.jsonl'
+        )
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def write_records(self, records, trailing_newline=True):
+        text = '\n'.join(json.dumps(r) for r in records)
+        with open(self.daily_file, 'w') as f:
+            f.write(text + '\n' if trailing_newline else text)
+
+    def analyze(self):
+        with contextlib.redirect_stdout(io.StringIO()):
+            return self.runner.analyze_benchmark_results()
+
+    def test_final_record_without_newline_is_counted(self):
+        """A complete last record with no trailing newline is still summarized"""
+        self.write_records([record('a', 1.0), record('b', 2.0)], trailing_newline=False)
+
+        summary = self.analyze()
+
+        self.assertEqual(summary['total_benchmarks'], 2)
+        self.assertEqual(set(summary['performance_summary']), {'a', 'b'})
+
+    def test_partial_final_line_is_left_for_next_run(self):
+        """A half-written last line is skipped, then counted once complete"""
+        self.write_records([record('a', 1.0)])
+        line = json.dumps(record('b', 2.0))
+        with open(self.daily_file, 'a') as f:
+            f.write(line[:10])
+
+        self.assertEqual(self.analyze()['total_benchmarks'], 1)
+
+        with open(self.daily_file, 'a') as f:
+            f.write(line[10:] + '\n')
+        summary = self.analyze()
+
+        self.assertEqual(summary['total_benchmarks'], 2)
+        self.assertEqual(set(summary['performance_summary']), {'a', 'b'})
+
+    @property
+    def cache_file(self):
+        today = datetime.now().strftime('%Y%m%d')
+        return self.runner.results_dir / 'reports' / f'benchmark_summary_{today}.cache.json'
+
+    def full_rescan(self):
+        os.remove(self.cache_file)
+        return self.analyze()
+
+    def cached_offset(self):
+        stat = os.stat(self.daily_file)
+        return self.runner.load_benchmark_cache(self.cache_file, self.daily_file, stat)['offset']
+
+    def test_appended_records_match_full_rescan(self):
+        """Totals built from the cache plus appended lines equal a fresh scan"""
+        self.write_records([record('a', 1.0, 2.0), record('b', 2.0, 3.0)])
+        self.analyze()
+        with open(self.daily_file, 'a') as f:
+            for r in (record('a', 4.0, 1.0), record('c', 0.5, 8.0)):
+                f.write(json.dumps(r) + '\n')
+
+        incremental = self.analyze()
+        self.assertEqual(self.cached_offset(), os.path.getsize(self.daily_file))
+        rescanned = self.full_rescan()
+
+        self.assertEqual(incremental['total_benchmarks'], 4)
+        self.assertEqual(incremental['performance_summary'], rescanned['performance_summary'])
+
+    def test_truncated_file_resets_cache(self):
+        """A file shorter than the cached offset is summarized from scratch"""
+        self.write_records([record('a', 1.0), record('b', 2.0), record('c', 3.0)])
+        self.analyze()
+        self.write_records([record('d', 4.0)])
+
+        self.assertEqual(self.cached_offset(), 0)
+        summary = self.analyze()
+
+        self.assertEqual(summary['total_benchmarks'], 1)
+        self.assertEqual(set(summary['performance_summary']), {'d'})
+
+    def test_rotated_file_resets_cache(self):
+        """A replaced file (new inode) is not read from the stale offset"""
+        self.write_records([record('a', 1.0), record('b', 2.0)])
+        self.analyze()
+        # Same-length lines, so the stale offset would land on a line boundary
+        replacement = self.daily_file + '.new'
+        with open(replacement, 'w') as f:
+            for r in (record('x', 1.0), record('y', 2.0), record('z', 3.0)):
+                f.write(json.dumps(r) + '\n')
+        os.replace(replacement, self.daily_file)
+
+        self.assertEqual(self.cached_offset(), 0)
+        summary = self.analyze()
+
+        self.assertEqual(summary['total_benchmarks'], 3)
+        self.assertEqual(set(summary['performance_summary']), {'x', 'y', 'z'})
+
+
+if __name__ == '__main__':
+    unittest.main()